@@ -1,5 +1,4 @@
 import streamlit as st
-from utils import load_master
 
 st.set_page_config(page_title="NBA Histórico Dashboard", layout="wide")
 
@@ -0,0 +1,194 @@
+"""
+Caché LRU de figuras Plotly compartida por todas las sesiones del proceso.
+
+Construir una figura con plotly.express es lo más caro de un rerun (validación
+de trazas, mucho más que serializarla), y se repetía aunque el widget que
+cambió no tuviera nada que ver con la gráfica. Aquí cada figura se guarda con
+una clave (versión del dataset, tipo de gráfica, parámetros) y solo se
+reconstruye si cambia algo de eso.
+
+La memoria está acotada: cada entrada cuenta lo que ocupa su JSON (lo mismo que
+se envía al navegador) y, al pasar del presupuesto, se expulsan las menos
+usadas recientemente.
+
+Plotly se importa dentro de las funciones: es la dependencia más pesada de la
+app y las páginas que no llegan a pintar una gráfica no deberían cargarla.
+"""
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+FIGURE_CACHE_ITEMS = 256
+
+# Gráficas de líneas: a partir de WEBGL_POINTS puntos se pinta con WebGL
+# (Scattergl) en vez de SVG, y ninguna serie pasa de MAX_POINTS_PER_SERIES
+WEBGL_POINTS = 1000
+MAX_POINTS_PER_SERIES = 400
+
+
+def _freeze(value):
+    """Parámetros -> valores hashables (listas/sets/dicts a tuplas)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
+
+
+def figure_key(version: str, chart: str, **params) -> tuple:
+    """Clave de una figura: versión del dataset + tipo de gráfica + parámetros."""
+    return (version, chart, _freeze(params))
+
+
+class FigureCache:
+    """LRU por bytes (tamaño del JSON de la figura) y por número de entradas."""
+
+    def __init__(self, max_bytes: int = FIGURE_CACHE_BYTES, max_items: int = FIGURE_CACHE_ITEMS):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self._items: OrderedDict[tuple, tuple["go.Figure", int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: tuple, build: Callable[[], "go.Figure"]) -> "go.Figure":
+        """
+        Figura de `key`; si no está, se construye con `build()` y se guarda.
+
+        La figura devuelta es compartida: no modificarla (st.plotly_chart solo la lee).
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+
+        # Fuera del lock: dos sesiones pueden construir la misma figura a la vez,
+        # pero ninguna bloquea a las demás mientras tanto
+        import plotly.io as pio
+
+        fig = build()
+        size = len(pio.to_json(fig, validate=False))
+        if size > self.max_bytes:
+            return fig
+
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._items[key] = (fig, size)
+            self.bytes += size
+            while self._items and (self.bytes > self.max_bytes or len(self._items) > self.max_items):
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.bytes -= evicted
+        return fig
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+
+def _rounded(s: pd.Series, decimals: int = 2) -> pd.Series:
+    """Stats float32 -> float64 redondeado: si no, las etiquetas muestran 27.399999618530273."""
+    return s.astype("float64").round(decimals)
+
+
+def top_bar(top: pd.DataFrame, metric: str) -> "go.Figure":
+    """Barras del top-N del Explorador (una métrica)."""
+    import plotly.express as px
+
+    top = top.assign(**{metric: _rounded(top[metric])})
+    return px.bar(top, x="player_name", y=metric, hover_data=["team", "pos", "g"], title="")
+
+
+def top_stacked(stacked: pd.DataFrame, metric: str, secondary: str, title: str) -> "go.Figure":
+    """Barras apiladas del top-N con dos métricas (datos en formato largo: metric/value)."""
+    import plotly.express as px
+
+    stacked = stacked.assign(value=_rounded(stacked["value"]))
+    return px.bar(stacked,
+                  x="player_name",
+                  y="value",
+                  color="metric",  # Different colors for each metric
+                  title=title,
+                  labels={"value": "Valor", "player_name": "Jugador"},
+                  color_discrete_map={metric: "blue", secondary: "orange"},  # Use distinct colors for each metric
+                  text="value")  # Show the value on top of bars
+
+
+# ---------------------------------------------------------------------------
+# Gráficas de líneas grandes: downsampling + WebGL
+# ---------------------------------------------------------------------------
+
+def lttb(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: posiciones de `n` puntos que conservan la
+    forma de la serie (x ordenada). Siempre incluye el primero y el último.
+    """
+    size = len(x)
+    if n >= size or n < 3:
+        return np.arange(size)
+
+    keep = np.empty(n, dtype=np.int64)
+    keep[0], keep[-1] = 0, size - 1
+    # n-2 cubos para los puntos interiores
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Punto "siguiente": media del cubo de la derecha (o el último punto)
+        nlo, nhi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else size
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        # Área del triángulo (a, candidato, media siguiente) para cada candidato del cubo
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def downsample(df: pd.DataFrame, x: str, y: str, by: str | None = None,
+               max_points: int = MAX_POINTS_PER_SERIES) -> pd.DataFrame:
+    """Filas de `df` reducidas con LTTB a como mucho `max_points` por serie (`by`)."""
+    groups = [df] if by is None else [g for _, g in df.groupby(by, sort=False, observed=True, dropna=False)]
+    if all(len(g) <= max_points for g in groups):
+        return df
+
+    parts = []
+    for g in groups:
+        # LTTB necesita x ordenada y sin huecos en y (los NaN cortan la línea igualmente)
+        g = g[g[y].notna()].sort_values(x, kind="stable")
+        xs = g[x].to_numpy(dtype="float64", na_value=np.nan)
+        ys = g[y].to_numpy(dtype="float64", na_value=np.nan)
+        parts.append(g.iloc[lttb(xs, ys, max_points)])
+    return pd.concat(parts)
+
+
+def line_figure(df: pd.DataFrame, x: str, y: str, color: str | None = None,
+                webgl_points: int = WEBGL_POINTS, max_points: int = MAX_POINTS_PER_SERIES,
+                **kwargs) -> "go.Figure":
+    """
+    px.line para series largas o muchas a la vez: cada serie se reduce con LTTB
+    si pasa de `max_points`, y por encima de `webgl_points` puntos en total se
+    usa WebGL en lugar de SVG. Para gráficas pequeñas es un px.line normal.
+    """
+    import plotly.express as px
+
+    df = downsample(df, x, y, by=color, max_points=max_points)
+    render_mode = "webgl" if len(df) > webgl_points else "svg"
+    return px.line(df, x=x, y=y, color=color, render_mode=render_mode, **kwargs)
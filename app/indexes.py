@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+
+from schema import player_keys
+
+# Columnas de texto con filtro multiselect en el Explorador
+BITMAP_COLS = ["lg", "team", "pos"]
+
+
+def _bitmap(n: int, rows: np.ndarray) -> np.ndarray:
+    mask = np.zeros(n, dtype=bool)
+    mask[rows] = True
+    return np.packbits(mask)
+
+
+def _value_bitmaps(s: pd.Series) -> dict:
+    """Un bitmap (1 bit por fila, empaquetado) por cada valor distinto de la columna."""
+    codes, values = pd.factorize(s, sort=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(values) + 1))
+    return {
+        v: _bitmap(len(s), order[bounds[k]:bounds[k + 1]])
+        for k, v in enumerate(values.tolist())
+    }
+
+
+def _sorted_order(s: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Ids de fila ordenados por valor (sin NA) y los valores en ese orden."""
+    values = pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    rows = np.flatnonzero(~np.isnan(values))
+    order = rows[np.argsort(values[rows], kind="stable")]
+    return order, values[order]
+
+
+class FilterIndex:
+    """
+    Índice de filtros del Explorador, construido una vez por versión del dataset.
+
+    - lg/team/pos: bitmap de filas por valor; un multiselect es el OR de sus valores.
+    - season_start_year y g: ids de fila ordenados por valor; un rango son dos
+      searchsorted sobre los offsets en vez de comparar toda la columna.
+
+    El resultado de rows() es la intersección (AND) de los bitmaps de cada filtro.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.n = len(df)
+        self.bitmaps = {c: _value_bitmaps(df[c]) for c in BITMAP_COLS if c in df.columns}
+        self.options = {c: list(bm) for c, bm in self.bitmaps.items()}
+
+        self.year_order, self.years_sorted = _sorted_order(df["season_start_year"])
+        self.games_order, self.games_sorted = _sorted_order(df["g"])
+
+        self.min_year = int(self.years_sorted[0]) if len(self.years_sorted) else 0
+        self.max_year = int(self.years_sorted[-1]) if len(self.years_sorted) else 0
+        self.max_games = int(self.games_sorted[-1]) if len(self.games_sorted) else 0
+
+    def _any_of(self, col: str, values: list) -> np.ndarray:
+        empty = np.zeros((self.n + 7) // 8, dtype=np.uint8)
+        bitmaps = [self.bitmaps[col][v] for v in values if v in self.bitmaps[col]]
+        return np.bitwise_or.reduce(bitmaps) if bitmaps else empty
+
+    def _between(self, order: np.ndarray, sorted_values: np.ndarray, lo=None, hi=None) -> np.ndarray:
+        i0 = 0 if lo is None else np.searchsorted(sorted_values, lo, side="left")
+        i1 = len(sorted_values) if hi is None else np.searchsorted(sorted_values, hi, side="right")
+        return _bitmap(self.n, order[i0:i1])
+
+    def mask(
+        self,
+        leagues: list | None = None,
+        year_range: tuple[int, int] | None = None,
+        teams: list | None = None,
+        positions: list | None = None,
+        min_games: int | None = None,
+    ) -> np.ndarray:
+        """Máscara booleana (una posición por fila) de las filas que cumplen todos los filtros."""
+        selected = []
+        for col, values in (("lg", leagues), ("team", teams), ("pos", positions)):
+            if values:
+                selected.append(self._any_of(col, values))
+        if year_range is not None:
+            selected.append(self._between(self.year_order, self.years_sorted, *year_range))
+        if min_games is not None:
+            selected.append(self._between(self.games_order, self.games_sorted, lo=min_games))
+
+        if not selected:
+            return np.ones(self.n, dtype=bool)
+        bits = np.bitwise_and.reduce(selected)
+        return np.unpackbits(bits, count=self.n).astype(bool)
+
+    def rows(self, **filters) -> np.ndarray:
+        """Ids de fila (posicionales, en orden original) que cumplen todos los filtros."""
+        return np.flatnonzero(self.mask(**filters))
+
+
+def _sort_order(df: pd.DataFrame, sort: tuple, rows: np.ndarray | None = None) -> np.ndarray:
+    """
+    argsort estable por varias columnas numéricas, como sort_values(kind="stable")
+    con los NA al final en cada clave.
+    """
+    rows = np.arange(len(df)) if rows is None else rows
+    keys = []
+    for col, ascending in reversed(sort):
+        v = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)[rows]
+        nan = np.isnan(v)
+        keys += [np.where(nan, 0.0, v if ascending else -v), nan]
+    return rows[np.lexsort(keys)] if keys else rows
+
+
+class RankIndex:
+    """
+    Órdenes precalculados (una vez por versión del dataset) para no ordenar en cada rerun.
+
+    - Por métrica: ranking global y ranking dentro de cada temporada (filas de la
+      temporada k en order[offsets[k]:offsets[k + 1]], de mayor a menor).
+    - Por cada orden multi-columna pedido (p.ej. el de la tabla del Explorador).
+
+    Con filtros, el top-N es el prefijo del ranking que pasa la máscara del
+    FilterIndex: sin sort, solo una selección parcial.
+    """
+
+    def __init__(self, df: pd.DataFrame, metrics: list, sorts: list):
+        codes, seasons = pd.factorize(df["season"])
+        self._season = {s: k for k, s in enumerate(seasons.tolist())}
+        valid = np.flatnonzero(codes >= 0)
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[valid], minlength=len(seasons)))])
+
+        self._global = {}
+        self._by_season = {}
+        for m in metrics:
+            if m not in df.columns:
+                continue
+            desc = ((m, False),)
+            self._global[desc] = _sort_order(df, desc)
+            # Dentro de cada temporada: orden estable por código de temporada del ranking global
+            ranked = self._global[desc]
+            ranked = ranked[codes[ranked] >= 0]
+            self._by_season[desc] = ranked[np.argsort(codes[ranked], kind="stable")]
+        for sort in sorts:
+            if all(c in df.columns for c, _ in sort):
+                self._global[tuple(sort)] = _sort_order(df, tuple(sort))
+
+    def order(self, sort: tuple, season=None) -> np.ndarray | None:
+        """Filas en el orden pedido (solo las de `season` si se indica); None si no está precalculado."""
+        sort = tuple(sort)
+        if season is None:
+            return self._global.get(sort)
+        if sort not in self._by_season:
+            return None
+        k = self._season.get(season)
+        if k is None:
+            return np.array([], dtype=np.int64)
+        return self._by_season[sort][self._offsets[k]:self._offsets[k + 1]]
+
+
+class PlayerIndex:
+    """
+    Filas de cada jugador agrupadas y ordenadas por temporada, con offsets.
+
+    order[offsets[k]:offsets[k + 1]] son las filas del jugador k (por
+    season_start_year), así que buscar a un jugador cuesta O(temporadas) en vez
+    de recorrer todo el master. La clave es player_keys(), no el nombre.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        codes, keys = pd.factorize(player_keys(df))
+        years = pd.to_numeric(df["season_start_year"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+        valid = np.flatnonzero(codes >= 0)
+        self.order = valid[np.lexsort((years[valid], codes[valid]))]
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[valid], minlength=len(keys)))])
+        self._code = {k: i for i, k in enumerate(keys.tolist())}
+
+        # Una fila por jugador (su primera temporada) para el desplegable, ordenada por nombre
+        first = self.order[self.offsets[:-1]]
+        players = pd.DataFrame({
+            "player_key": keys.tolist(),
+            "player_name": df["player_name"].astype("string").to_numpy()[first],
+            "league": df["league"].astype("string").to_numpy()[first],
+        })
+        self.players = players.sort_values(["player_name", "league"], kind="stable").reset_index(drop=True)
+        self._names = dict(zip(players["player_key"], players["player_name"]))
+        self._labels = dict(zip(players["player_key"], players["player_name"] + " (" + players["league"] + ")"))
+
+    def rows(self, keys: list) -> np.ndarray:
+        """Ids de fila de los jugadores pedidos, cada uno ordenado por temporada."""
+        parts = [
+            self.order[self.offsets[k]:self.offsets[k + 1]]
+            for k in (self._code.get(key) for key in keys) if k is not None
+        ]
+        return np.concatenate(parts) if parts else np.array([], dtype=np.int64)
+
+    def name(self, key: str) -> str:
+        return self._names.get(key, key)
+
+    def label(self, key: str) -> str:
+        """Nombre con la liga, para distinguir homónimos en los desplegables."""
+        return self._labels.get(key, key)
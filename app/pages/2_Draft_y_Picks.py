@@ -1,14 +1,19 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from utils import load_master
+import perf
+from figures import line_figure
+from schema import player_keys
+from utils import cached_figure, dataset_version, get_player_index, load_master_shared
 
 st.set_page_config(page_title="Draft y Picks", layout="wide")
 st.title("🎯 Draft y Picks")
+perf.start_page("Draft y Picks")
 
-# Cargar los datos
-df = load_master()  # dataframe completo (NO filtrado)
-f = df.copy()       # copia para filtros de tabla 2
+# Cargar los datos (de la versión publicada del master)
+version = dataset_version()
+df = load_master_shared(version)  # dataframe completo (NO filtrado, compartido: no modificar en sitio)
+f = df              # base para filtros de tabla 2 (los filtros devuelven frames nuevos)
+pidx = get_player_index(version)  # filas por jugador para las gráficas
 
 # --- Métricas disponibles y nombres bonitos ---
 METRICS = {
@@ -30,38 +35,30 @@ X_OPTIONS = {
     "Temporada normalizada (desde rookie)": ("career_year", "Año de carrera (1 = rookie)"),
 }
 
+# rookie_season_start_year / career_year vienen precalculadas del build
+# (scripts/build_master_all_leagues.py), aquí solo se leen.
 
 
-# Asegura que season_start_year existe (si no, lo calculas desde season)
-if "season_start_year" not in df.columns and "season" in df.columns:
-    # "2018-19" -> 2018
-    df["season_start_year"] = pd.to_numeric(df["season"].astype(str).str.slice(0, 4), errors="coerce")
-
-# --- Build normalized career year (Year 1, 2, 3...) ---
-# Compute rookie season as first season_start_year present in the dataset for each player
-rookie = (
-    df.dropna(subset=["season_start_year"])
-      .groupby("player_name", as_index=False)["season_start_year"]
-      .min()
-      .rename(columns={"season_start_year": "rookie_season_start_year"})
-)
-
-# Comprobar si existe la columna rookie_season_start_year
-if "rookie_season_start_year" not in df.columns:
-    # Solo para NBA, ya que NCAA y WNBA no tienen esa columna
-    if "nba" in df["lg"].unique():
-        rookie = (
-            df.dropna(subset=["season_start_year"])
-            .groupby("player_name", as_index=False)["season_start_year"]
-            .min()
-            .rename(columns={"season_start_year": "rookie_season_start_year"})
-        )
-        df = df.merge(rookie, on="player_name", how="left")
+def evolution_figure(data, x_col, x_label, metric, metric_label, y_label, players):
+    # Con muchos jugadores pasa a WebGL y reduce las series largas (figures.line_figure)
+    fig = line_figure(
+        data,
+        x=x_col,
+        y=metric,
+        color="player_name",
+        markers=True,
+        title=f"{metric_label} — ({', '.join(map(pidx.name, players))})",
+        labels={x_col: x_label, metric: y_label},
+    )
 
-# Ahora puedes calcular la columna career_year
-df["career_year"] = df["season_start_year"] - df["rookie_season_start_year"] + 1
-df.loc[df["career_year"] < 1, "career_year"] = pd.NA  # Safety
+    # Opcional: que el eje X sea entero si es temporada
+    if x_col == "season_start_year":
+        fig.update_xaxes(dtick=1)
 
+    # Opcional: formato % para porcentajes
+    if metric.endswith("_percent"):
+        fig.update_yaxes(tickformat=".0%")
+    return fig
 
 
 # Sidebar filters
@@ -74,12 +71,13 @@ pick_value = st.sidebar.number_input("Pick overall (ej. 1)", min_value=1, max_va
 # Selector de año encima de la tabla 1
 selected_draft_year = st.selectbox("Seleccionar año de draft", range(min_dy, max_dy + 1), key="year_select")
 
-# Tabla 1: jugadores drafteados ese año (usa df completo)
-filtros_draft_year = df[df["draft_year"] == selected_draft_year]
+with perf.timer("draft_filters"):
+    # Tabla 1: jugadores drafteados ese año (usa df completo)
+    filtros_draft_year = df[df["draft_year"] == selected_draft_year]
 
-# Tabla 2: filtras f para pick + rango
-f = f[(f["draft_year"] >= draft_year_range[0]) & (f["draft_year"] <= draft_year_range[1])]
-f = f[f["draft_pick"] == pick_value]
+    # Tabla 2: filtras f para pick + rango
+    f = f[(f["draft_year"] >= draft_year_range[0]) & (f["draft_year"] <= draft_year_range[1])]
+    f = f[f["draft_pick"] == pick_value]
 
 # --------------------
 # TABLA 1 + GRÁFICA 1
@@ -88,17 +86,19 @@ st.subheader(f"Jugadores drafteados en {selected_draft_year}")
 if len(filtros_draft_year) == 0:
     st.warning(f"No hay jugadores drafteados en {selected_draft_year}.")
 else:
-    filtros_draft_year_unique = filtros_draft_year.drop_duplicates(subset=["player_name"])
-    st.dataframe(
-        filtros_draft_year_unique[["player_name", "team", "draft_pick", "draft_team", "college"]],
-        use_container_width=True
-    )
+    with perf.timer("table_1"):
+        filtros_draft_year_unique = filtros_draft_year.drop_duplicates(subset=["player_name"])
+        st.dataframe(
+            filtros_draft_year_unique[["player_name", "team", "draft_pick", "draft_team", "college"]],
+            use_container_width=True
+        )
 
     st.subheader("Evolución de los jugadores seleccionados")
 
     selected_players_1 = st.multiselect(
         "Seleccionar jugadores para comparar en la Gráfica 1",
-        filtros_draft_year_unique["player_name"].unique(),
+        player_keys(filtros_draft_year_unique).unique(),
+        format_func=pidx.name,
         key="players_graph_1"
     )
 
@@ -126,37 +126,29 @@ else:
         max_career_year = st.slider("Limitar a los primeros N años de carrera (Gráfica 1)", 3, 25, 15, key="cy_lim_1")
 
     if selected_players_1:
-        selected_data_1 = df[df["player_name"].isin(selected_players_1)].copy()
+        with perf.timer("players_1"):
+            selected_data_1 = df.take(pidx.rows(selected_players_1))
 
-        # Filtrar nulos en X e Y
-        selected_data_1 = selected_data_1[selected_data_1[metric_1].notna() & selected_data_1[x_col_1].notna()]
+            # Filtrar nulos en X e Y
+            selected_data_1 = selected_data_1[selected_data_1[metric_1].notna() & selected_data_1[x_col_1].notna()]
 
-        if max_career_year is not None:
-            selected_data_1 = selected_data_1[selected_data_1["career_year"] <= max_career_year]
+            if max_career_year is not None:
+                selected_data_1 = selected_data_1[selected_data_1["career_year"] <= max_career_year]
 
-        # Ordenar para que líneas salgan bien (sobre todo por edad)
-        selected_data_1 = selected_data_1.sort_values([ "player_name", x_col_1 ])
+            # Ordenar para que líneas salgan bien (sobre todo por edad)
+            selected_data_1 = selected_data_1.sort_values([ "player_name", x_col_1 ])
 
         if len(selected_data_1) > 0:
-            fig_1 = px.line(
-                selected_data_1,
-                x=x_col_1,
-                y=metric_1,
-                color="player_name",
-                markers=True,
-                title=f"{metric_label_1} — ({', '.join(selected_players_1)})",
-                labels={x_col_1: x_label_1, metric_1: metric_y_label_1},
+            # Misma figura (y misma entrada de caché) en la Gráfica 1 y 2 si coinciden los parámetros
+            fig_1 = cached_figure(
+                version, "draft_evolution",
+                lambda: evolution_figure(selected_data_1, x_col_1, x_label_1, metric_1, metric_label_1,
+                                         metric_y_label_1, selected_players_1),
+                players=selected_players_1, x=x_col_1, metric=metric_1, max_career_year=max_career_year,
             )
 
-            # Opcional: que el eje X sea entero si es temporada
-            if x_col_1 == "season_start_year":
-                fig_1.update_xaxes(dtick=1)
-
-            # Opcional: formato % para porcentajes
-            if metric_1.endswith("_percent"):
-                fig_1.update_yaxes(tickformat=".0%")
-
-            st.plotly_chart(fig_1, use_container_width=True, key="graph_1")
+            with perf.timer("plotly_chart"):
+                st.plotly_chart(fig_1, use_container_width=True, key="graph_1")
         else:
             st.warning("No hay datos disponibles (revisa eje X o métrica).")
     else:
@@ -169,17 +161,19 @@ st.subheader(f"Jugadores seleccionados con el pick #{pick_value} en el rango de
 if len(f) == 0:
     st.warning(f"No hay jugadores con el pick #{pick_value} en ese rango de años.")
 else:
-    f_unique = f.drop_duplicates(subset=["player_name"])
-    st.dataframe(
-        f_unique[["player_name", "draft_year", "draft_team", "college", "draft_pick"]],
-        use_container_width=True
-    )
+    with perf.timer("table_2"):
+        f_unique = f.drop_duplicates(subset=["player_name"])
+        st.dataframe(
+            f_unique[["player_name", "draft_year", "draft_team", "college", "draft_pick"]],
+            use_container_width=True
+        )
 
     st.subheader("Evolución de los jugadores seleccionados con el pick determinado")
 
     selected_players_2 = st.multiselect(
         "Seleccionar jugadores para comparar en la Gráfica 2",
-        f_unique["player_name"].unique(),
+        player_keys(f_unique).unique(),
+        format_func=pidx.name,
         key="players_graph_2"
     )
 
@@ -204,33 +198,28 @@ else:
         max_career_year = st.slider("Limitar a los primeros N años de carrera (Gráfica 1)", 3, 25, 15, key="cy_lim_2")
 
     if selected_players_2:
-        selected_data_2 = df[df["player_name"].isin(selected_players_2)].copy()
-        selected_data_2 = selected_data_2[selected_data_2[metric_2].notna() & selected_data_2[x_col_2].notna()]
+        with perf.timer("players_2"):
+            selected_data_2 = df.take(pidx.rows(selected_players_2))
+            selected_data_2 = selected_data_2[selected_data_2[metric_2].notna() & selected_data_2[x_col_2].notna()]
 
-        if max_career_year is not None:
-            selected_data_2 = selected_data_2[selected_data_2["career_year"] <= max_career_year]
+            if max_career_year is not None:
+                selected_data_2 = selected_data_2[selected_data_2["career_year"] <= max_career_year]
 
-        selected_data_2 = selected_data_2.sort_values(["player_name", x_col_2])
+            selected_data_2 = selected_data_2.sort_values(["player_name", x_col_2])
 
         if len(selected_data_2) > 0:
-            fig_2 = px.line(
-                selected_data_2,
-                x=x_col_2,
-                y=metric_2,
-                color="player_name",
-                markers=True,
-                title=f"{metric_label_2} — ({', '.join(selected_players_2)})",
-                labels={x_col_2: x_label_2, metric_2: metric_y_label_2},
+            fig_2 = cached_figure(
+                version, "draft_evolution",
+                lambda: evolution_figure(selected_data_2, x_col_2, x_label_2, metric_2, metric_label_2,
+                                         metric_y_label_2, selected_players_2),
+                players=selected_players_2, x=x_col_2, metric=metric_2, max_career_year=max_career_year,
             )
 
-            if x_col_2 == "season_start_year":
-                fig_2.update_xaxes(dtick=1)
-
-            if metric_2.endswith("_percent"):
-                fig_2.update_yaxes(tickformat=".0%")
-
-            st.plotly_chart(fig_2, use_container_width=True, key="graph_2")
+            with perf.timer("plotly_chart"):
+                st.plotly_chart(fig_2, use_container_width=True, key="graph_2")
         else:
             st.warning("No hay datos disponibles (revisa eje X o métrica).")
     else:
-        st.warning("Selecciona al menos un jugador para ver la evolución en la Gráfica 2.")
\ No newline at end of file
+        st.warning("Selecciona al menos un jugador para ver la evolución en la Gráfica 2.")
+
+perf.finish_page()
@@ -1,17 +1,22 @@
 import streamlit as st
-import plotly.express as px
-from utils import load_master
+import perf
+from figures import line_figure
+from utils import cached_figure, dataset_version, get_player_index, load_master_shared
 
 st.set_page_config(page_title="Jugador", layout="wide")
 st.title("👤 Perfil de jugador")
+perf.start_page("Jugador")
 
-df = load_master()
+version = dataset_version()
+df = load_master_shared(version)
+pidx = get_player_index(version)
 
-# Player selector
-players = df[["player_id","player_name"]].drop_duplicates().sort_values("player_name")
-player_name = st.selectbox("Selecciona jugador", players["player_name"].tolist())
+# Player selector (lista ordenada precalculada; la clave es el id estable del jugador)
+player_key = st.selectbox("Selecciona jugador", pidx.players["player_key"].tolist(), format_func=pidx.label)
 
-p = df[df["player_name"] == player_name].copy().sort_values("season_start_year")
+# Filas del jugador ya ordenadas por temporada (slice del índice, sin recorrer el master)
+with perf.timer("player_rows"):
+    p = df.take(pidx.rows([player_key]))
 
 # Header info
 info = p[["player_id","player_name","draft_year","draft_round","draft_pick","draft_team","college"]].drop_duplicates().head(1)
@@ -26,10 +31,19 @@ c4.metric("REB media", f"{p['trb_per_game'].mean():.2f}")
 st.divider()
 
 metric = st.selectbox("Métrica para evolución", ["pts_per_game","ast_per_game","trb_per_game","mp_per_game","fg_percent","x3p_percent","ft_percent"])
-fig = px.line(p, x="season_start_year", y=metric, markers=True, hover_data=["team","season","pos","g"])
-st.plotly_chart(fig, use_container_width=True)
+fig = cached_figure(
+    version, "player_evolution",
+    lambda: line_figure(p, x="season_start_year", y=metric, markers=True, hover_data=["team","season","pos","g"]),
+    player=player_key, metric=metric,
+)
+with perf.timer("plotly_chart"):
+    st.plotly_chart(fig, use_container_width=True)
 
 st.divider()
 st.subheader("Tabla por temporada")
 cols = ["season","lg","team","pos","age","g","gs","mp_per_game","pts_per_game","trb_per_game","ast_per_game","fg_percent","x3p_percent","ft_percent"]
-st.dataframe(p[cols], use_container_width=True)
+with perf.timer("dataframe"):
+    st.dataframe(p[cols], use_container_width=True)
+
+perf.finish_page()
+
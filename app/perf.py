@@ -0,0 +1,142 @@
+"""
+Instrumentación ligera de los reruns: cuánto tarda cada etapa de cada página.
+
+    perf.start_page("Explorador")        # al principio de la página
+    with perf.timer("top_query"):        # alrededor de cada etapa
+        ...
+    @perf.timed("load_master")           # o como decorador
+    perf.finish_page()                   # al final: total del rerun + panel de debug
+
+Cada medida va a dos sitios:
+- el rerun actual (se muestra en el panel de debug de la barra lateral);
+- un histórico acotado por (página, etapa) compartido por todo el proceso, del
+  que salen p50/p95 (stats()) y el JSON del botón de exportar (export()).
+
+Medir es un perf_counter y un append: se deja siempre activo. El panel solo
+aparece con ?debug=1 en la URL o DASHBOARD_DEBUG=1 en el entorno, y cada rerun
+se registra además como una línea JSON en el logger "perf" (nivel DEBUG).
+"""
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+import streamlit as st
+
+DEBUG_ENV = "DASHBOARD_DEBUG"
+MAX_SAMPLES = 1000          # medidas guardadas por (página, etapa)
+NO_PAGE = "-"               # etapas medidas fuera de una página (p.ej. el warm-up)
+
+log = logging.getLogger("perf")
+
+_samples: dict[tuple[str, str], deque] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+_lock = threading.Lock()
+# Página y medidas del rerun en curso (cada rerun corre en su propio hilo/contexto)
+_run: contextvars.ContextVar = contextvars.ContextVar("perf_run", default=None)
+
+
+def start_page(page: str) -> None:
+    _run.set({"page": page, "start": time.perf_counter(), "stages": []})
+
+
+def record(stage: str, seconds: float) -> None:
+    run = _run.get()
+    page = run["page"] if run else NO_PAGE
+    if run is not None:
+        run["stages"].append((stage, seconds))
+    with _lock:
+        _samples[(page, stage)].append(seconds)
+
+
+@contextmanager
+def timer(stage: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - t0)
+
+
+def timed(stage: str):
+    """Decorador: mide cada llamada a la función como la etapa `stage`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def stats() -> dict:
+    """{página: {etapa: {n, p50_ms, p95_ms, max_ms}}} con el histórico del proceso."""
+    with _lock:
+        snapshot = {key: np.fromiter(values, dtype="float64") for key, values in _samples.items()}
+    out: dict = defaultdict(dict)
+    for (page, stage), values in sorted(snapshot.items()):
+        p50, p95 = np.percentile(values, [50, 95]) * 1e3
+        out[page][stage] = {
+            "n": len(values),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "max_ms": round(float(values.max()) * 1e3, 2),
+        }
+    return dict(out)
+
+
+def export() -> str:
+    """stats() del proceso como JSON (para comparar entre versiones o bajo carga)."""
+    return json.dumps({"pid": os.getpid(), "stats": stats()}, indent=2)
+
+
+def debug_enabled() -> bool:
+    return os.environ.get(DEBUG_ENV) == "1" or st.query_params.get("debug") == "1"
+
+
+def finish_page() -> None:
+    """Cierra el rerun: registra el total, lo manda al log y pinta el panel si hay debug."""
+    run = _run.get()
+    if run is None:
+        return
+    total = time.perf_counter() - run["start"]
+    record("rerun", total)
+    # Una etapa puede repetirse en el mismo rerun: se suman sus tiempos
+    stages: dict[str, float] = defaultdict(float)
+    for stage, s in run["stages"]:
+        if stage != "rerun":
+            stages[stage] += s * 1e3
+    log.debug(json.dumps({
+        "page": run["page"],
+        "rerun_ms": round(total * 1e3, 2),
+        "stages": {stage: round(ms, 2) for stage, ms in stages.items()},
+    }))
+    if debug_enabled():
+        _panel(run, total)
+    _run.set(None)
+
+
+def _panel(run: dict, total: float) -> None:
+    page_stats = stats().get(run["page"], {})
+    with st.sidebar.expander("⏱ Rendimiento", expanded=False):
+        st.caption(f"Este rerun: {total * 1e3:.0f} ms")
+        st.dataframe(
+            [{"etapa": stage, "ms": round(s * 1e3, 1)} for stage, s in run["stages"] if stage != "rerun"],
+            hide_index=True, use_container_width=True,
+        )
+        st.caption("Histórico del proceso (p50 / p95)")
+        st.dataframe(
+            [{"etapa": stage, **v} for stage, v in page_stats.items()],
+            hide_index=True, use_container_width=True,
+        )
+        st.download_button(
+            "Exportar métricas (JSON)",
+            export(),
+            file_name="dashboard_perf.json",
+            mime="application/json",
+        )
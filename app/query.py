@@ -0,0 +1,214 @@
+"""
+Capa de consultas de las páginas: filtros + orden + top-N -> DataFrame pequeño.
+
+Las páginas describen lo que necesitan con un Query (filtros, columnas, orden,
+límite) y un motor lo resuelve:
+
+- PandasEngine (por defecto): sobre el master compartido ya cargado en memoria
+  (mapeado del Arrow) + FilterIndex. Los rankings por métrica/temporada y el
+  orden de la tabla vienen precalculados (RankIndex).
+- ArrowEngine (opcional, DASHBOARD_ENGINE=arrow): pyarrow.dataset sobre la
+  copia Arrow publicada de la versión (mapeada, sin pasar el master a pandas),
+  para un master que no quepa en memoria. Solo se leen las columnas pedidas,
+  pero cada consulta recorre y filtra todas las filas: con el master actual es
+  bastante más lento que PandasEngine (ver benchmarks/run_benchmarks.py,
+  explorer_view_*).
+
+En ambos motores un top-N es una selección parcial, no un sort completo.
+"""
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from indexes import BITMAP_COLS, FilterIndex, RankIndex
+
+# Métricas con ranking precalculado (las del Explorador) y orden de su tabla
+RANK_METRICS = ["pts_per_game", "ast_per_game", "trb_per_game", "mp_per_game", "fg_percent", "x3p_percent", "ft_percent"]
+TABLE_SORT = (("season_start_year", False), ("pts_per_game", False))   # Desc; Asc = el mismo invertido
+
+# Vista inicial del Explorador (la misma que precalienta warmup.py al arrancar)
+EXPLORER_LEAGUES = ("NBA",)
+EXPLORER_FIRST_YEAR = 2000
+EXPLORER_MIN_GAMES = 20
+EXPLORER_TOP_N = 20
+KPI_COLUMNS = ("player_id", "season_start_year", "season")
+TOP_COLUMNS = ("player_name", "team", "pos", "g")
+TABLE_COLUMNS = [
+    "season", "lg", "player_name", "team", "pos", "age", "g",
+    "mp_per_game", "pts_per_game", "trb_per_game", "ast_per_game",
+    "fg_percent", "x3p_percent", "ft_percent",
+    "draft_year", "draft_round", "draft_pick", "draft_team", "college", "season_start_year",
+]
+
+ENGINE_ENV = "DASHBOARD_ENGINE"   # "arrow" -> ArrowEngine (por defecto PandasEngine)
+ROW_ID = "__row"   # columna auxiliar de desempate al ordenar (ArrowEngine)
+
+
+@dataclass(frozen=True)
+class Query:
+    leagues: tuple = ()                             # valores de lg (OR)
+    year_range: tuple[int, int] | None = None       # season_start_year, ambos incluidos
+    teams: tuple = ()
+    positions: tuple = ()
+    min_games: int | None = None
+    season: str | None = None                       # etiqueta exacta de season
+    columns: tuple[str, ...] | None = None          # None = todas
+    sort: tuple[tuple[str, bool], ...] = ()         # ((columna, ascendente), ...)
+    limit: int | None = None                        # top-N tras ordenar
+    offset: int = 0                                 # filas a saltar (paginación)
+
+
+@dataclass(frozen=True)
+class Options:
+    """Valores para los widgets de filtro (mismos que FilterIndex.options)."""
+    lg: list
+    team: list
+    pos: list
+    min_year: int
+    max_year: int
+    max_games: int
+
+
+class PandasEngine:
+    name = "pandas"
+
+    def __init__(self, df: pd.DataFrame, index: FilterIndex):
+        self.df = df
+        self.index = index
+        self.ranks = RankIndex(df, RANK_METRICS, [TABLE_SORT, tuple((c, not a) for c, a in TABLE_SORT)])
+        self.columns = list(df.columns)
+        self.options = Options(
+            **{c: index.options.get(c, []) for c in BITMAP_COLS},
+            min_year=index.min_year, max_year=index.max_year, max_games=index.max_games,
+        )
+
+    def _mask(self, q: Query) -> np.ndarray:
+        mask = self.index.mask(
+            leagues=list(q.leagues),
+            year_range=q.year_range,
+            teams=list(q.teams),
+            positions=list(q.positions),
+            min_games=q.min_games,
+        )
+        if q.season is not None:
+            mask &= (self.df["season"] == q.season).to_numpy(dtype=bool, na_value=False)
+        return mask
+
+    def count(self, q: Query) -> int:
+        return int(self._mask(q).sum())
+
+    def run(self, q: Query) -> pd.DataFrame:
+        mask = self._mask(q)
+        cols = self.df.columns.get_indexer(list(q.columns)) if q.columns is not None else slice(None)
+        stop = None if q.limit is None else q.offset + q.limit
+
+        # Orden precalculado: las filas ya vienen ordenadas, solo se filtran
+        order = self.ranks.order(q.sort, q.season) if q.sort else None
+        if order is not None:
+            rows = order[mask[order]][q.offset:stop]
+            return self.df.iloc[rows, cols].reset_index(drop=True)
+
+        f = self.df.iloc[np.flatnonzero(mask)]
+        col, ascending = q.sort[0] if len(q.sort) == 1 else (None, None)
+        # Selección parcial (nlargest/nsmallest) solo para la primera página: descarta los NA,
+        # así que solo vale si hay al menos `stop` valores (si no, sort estable con NA al final)
+        if (
+            q.offset == 0 and stop is not None and col is not None
+            and pd.api.types.is_numeric_dtype(f[col]) and f[col].count() >= stop
+        ):
+            top = f[col].nsmallest(stop) if ascending else f[col].nlargest(stop)
+            f = f.loc[top.index]
+        elif q.sort:
+            f = f.sort_values([c for c, _ in q.sort], ascending=[a for _, a in q.sort], kind="stable")
+        return f.iloc[q.offset:stop, cols].reset_index(drop=True)
+
+
+class ArrowEngine:
+    name = "arrow"
+
+    def __init__(self, path: Path):
+        # Fichero Arrow de una versión concreta (inmutable): mapeado, no se copia a memoria
+        # y sigue siendo válido aunque se publique (o se borre) una versión nueva
+        self.path = path
+        self._all = ds.dataset(pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all())
+        self.columns = self._all.schema.names
+        self.options = self._options()
+
+    def _options(self) -> Options:
+        t = self._all.to_table(columns=BITMAP_COLS + ["season_start_year", "g"])
+
+        def values(col: str) -> list:
+            return sorted(pc.unique(t[col].drop_null()).cast("string").to_pylist()) if col in t.column_names else []
+
+        years = pc.min_max(t["season_start_year"])
+        return Options(
+            **{c: values(c) for c in BITMAP_COLS},
+            min_year=int(years["min"].as_py() or 0),
+            max_year=int(years["max"].as_py() or 0),
+            max_games=int(pc.max(t["g"]).as_py() or 0),
+        )
+
+    @staticmethod
+    def _filter(q: Query):
+        conds = []
+        for col, values in (("lg", q.leagues), ("team", q.teams), ("pos", q.positions)):
+            if values:
+                conds.append(pc.field(col).isin(list(values)))
+        if q.year_range is not None:
+            lo, hi = q.year_range
+            conds.append((pc.field("season_start_year") >= lo) & (pc.field("season_start_year") <= hi))
+        if q.min_games is not None:
+            conds.append(pc.field("g") >= q.min_games)
+        if q.season is not None:
+            conds.append(pc.field("season") == q.season)
+
+        expr = None
+        for c in conds:
+            expr = c if expr is None else expr & c
+        return expr
+
+    def count(self, q: Query) -> int:
+        return self._all.count_rows(filter=self._filter(q))
+
+    def run(self, q: Query) -> pd.DataFrame:
+        # Columnas a leer: las pedidas más las de ordenación (se descartan al final)
+        wanted = list(q.columns) if q.columns is not None else list(self.columns)
+        read = wanted + [c for c, _ in q.sort if c not in wanted]
+        table = self._all.to_table(columns=read, filter=self._filter(q))
+
+        if q.sort:
+            # Arrow no ordena columnas dictionary: se ordena por una copia decodificada
+            keys = []
+            for i, (c, ascending) in enumerate(q.sort):
+                if pa.types.is_dictionary(table.schema.field(c).type):
+                    table = table.append_column(f"__sort{i}", table[c].cast(pa.string()))
+                    c = f"__sort{i}"
+                keys.append((c, "ascending" if ascending else "descending"))
+            # Desempate por posición de la fila: orden total, igual en todas las páginas
+            table = table.append_column(ROW_ID, pa.array(np.arange(table.num_rows)))
+            keys.append((ROW_ID, "ascending"))
+
+            stop = None if q.limit is None else q.offset + q.limit
+            if q.offset == 0 and stop is not None and table.num_rows > stop:
+                # Top-N: selección parcial y solo se ordenan las filas elegidas
+                table = table.take(pc.select_k_unstable(table, k=stop, sort_keys=keys))
+            table = table.sort_by(keys)
+
+        table = table.slice(q.offset, q.limit)
+        return table.select(wanted).to_pandas()
+
+
+def make_engine(df_loader, index_loader, source: Path):
+    """
+    PandasEngine sobre el master compartido; ArrowEngine sobre la copia Arrow
+    publicada (`source`, la de la versión) solo si se pide con DASHBOARD_ENGINE=arrow.
+    """
+    if os.environ.get(ENGINE_ENV) == "arrow" and source.suffix == ".arrow":
+        return ArrowEngine(source)
+    return PandasEngine(df_loader(), index_loader())
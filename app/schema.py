@@ -0,0 +1,107 @@
+import pandas as pd
+
+# Columnas "core" que queremos tener siempre (aunque sea con NA)
+CORE_COLS = [
+    "league", "lg",
+    "season", "season_start_year",
+    "player_name", "player_id",
+    "team", "pos", "age", "g",
+    "mp_per_game",
+    "pts_per_game", "ast_per_game", "trb_per_game",
+    "orb_per_game", "drb_per_game",
+    "stl_per_game", "blk_per_game", "tov_per_game", "pf_per_game",
+    "fg_per_game", "fga_per_game", "fg_percent",
+    "x3p_per_game", "x3pa_per_game", "x3p_percent",
+    "ft_per_game", "fta_per_game", "ft_percent",
+    "draft_year", "draft_round", "draft_pick", "draft_team", "college",
+    "rookie_season_start_year", "career_year",
+]
+
+# Texto de baja cardinalidad -> category (códigos int8/int16 + diccionario)
+CATEGORY_COLS = ["league", "lg", "team", "pos", "season", "draft_team", "college", "class"]
+
+# Años, picks y partidos -> enteros pequeños con NA
+INT_COLS = {
+    "season_start_year": "Int16",
+    "age": "Int8",
+    "g": "Int16",
+    "gs": "Int16",
+    "draft_year": "Int16",
+    "draft_round": "Int8",
+    "draft_pick": "Int16",
+    "rookie_season_start_year": "Int16",
+    "career_year": "Int8",
+}
+
+# Stats por partido y porcentajes -> float32 (sobra precisión para 1-3 decimales)
+FLOAT_SUFFIXES = ("_per_game", "_percent")
+FLOAT_DTYPE = "float32"
+
+
+def _to_int(s: pd.Series, dtype: str) -> pd.Series:
+    s = pd.to_numeric(s, errors="coerce")
+    # Si alguna fila trae decimales no la truncamos: mejor float32 que perder datos
+    if (s.dropna() % 1 != 0).any():
+        return s.astype(FLOAT_DTYPE)
+    return s.astype(dtype)
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Aplica los tipos compactos del master a las columnas que existan."""
+    df = df.copy()
+
+    for c in CATEGORY_COLS:
+        if c in df.columns:
+            # Pasamos por string: en el CSV conviven "2018-19" y 2003 en la misma columna
+            df[c] = df[c].astype("string").astype("category")
+
+    for c, dtype in INT_COLS.items():
+        if c in df.columns:
+            df[c] = _to_int(df[c], dtype)
+
+    for c in df.columns:
+        if c.endswith(FLOAT_SUFFIXES):
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype(FLOAT_DTYPE)
+
+    return df
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Memoria por columna (MB) antes/después de aplicar el esquema, de mayor a menor ahorro."""
+    mb = 1024 ** 2
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.reindex(before.columns).astype(str),
+        "mb_before": before.memory_usage(deep=True, index=False) / mb,
+        "mb_after": after.memory_usage(deep=True, index=False).reindex(before.columns) / mb,
+    })
+    report["mb_saved"] = report["mb_before"] - report["mb_after"]
+    return report.sort_values("mb_saved", ascending=False)
+
+
+def player_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Id estable de jugador: player_id si existe (NBA), si no "LIGA:nombre".
+
+    WNBA y NCAA no traen player_id; el nombre solo es único dentro de cada liga.
+    """
+    pid = df["player_id"].astype("string")
+    fallback = df["league"].astype("string") + ":" + df["player_name"].astype("string")
+    return pid.fillna(fallback)
+
+
+def add_career_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    rookie_season_start_year / career_year para todas las ligas a la vez.
+
+    Rookie = primera temporada del jugador dentro de su liga (groupby + transform,
+    sin merge). career_year = 1 en la temporada rookie; valores < 1 quedan NA.
+    """
+    df = df.copy()
+    start = pd.to_numeric(df["season_start_year"], errors="coerce")
+    rookie = start.groupby([df["league"], player_keys(df)], dropna=False, observed=True).transform("min")
+    career = start - rookie + 1
+
+    df["rookie_season_start_year"] = rookie
+    df["career_year"] = career.where(career >= 1)
+    return df
@@ -0,0 +1,41 @@
+"""
+Arranque del dashboard con precalentado de cachés (warmup.py).
+
+Equivale a `streamlit run app/Home.py`, pero en el mismo proceso lanza un hilo
+que carga el master, los índices y la vista inicial del Explorador mientras el
+servidor arranca, así que el primer usuario no paga esa carga.
+
+Uso (desde la raíz del proyecto; el resto de argumentos van a streamlit):
+    python app/serve.py
+    python app/serve.py --server.port 8502 --server.headless true
+"""
+import os
+import sys
+from pathlib import Path
+
+from streamlit.web import cli
+
+from warmup import DEFAULT_PORT, start_warmup
+
+HOME = Path(__file__).resolve().parent / "Home.py"
+
+
+def server_port(args: list[str]) -> int:
+    """Puerto en el que servirá Streamlit: --server.port o STREAMLIT_SERVER_PORT (como streamlit run)."""
+    for i, arg in enumerate(args):
+        if arg.startswith("--server.port="):
+            return int(arg.split("=", 1)[1])
+        if arg == "--server.port" and i + 1 < len(args):
+            return int(args[i + 1])
+    return int(os.environ.get("STREAMLIT_SERVER_PORT", DEFAULT_PORT))
+
+
+def main():
+    # El marcador de precalentado va por puerto: es el que consultará el healthcheck
+    start_warmup(server_port(sys.argv[1:]))
+    sys.argv = ["streamlit", "run", str(HOME), *sys.argv[1:]]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from schema import apply_schema
+
+# Copia columnar del master: un fichero Parquet por liga, con las filas ordenadas
+# por temporada (los row groups quedan por rangos de años y sus estadísticas
+# permiten saltar los que no entran en un filtro de años)
+#   master_all_leagues.parquet/league=NBA/part-0.parquet
+# más un manifest (_manifest.json) con las particiones y sus filas. Por temporada
+# salían ~130 ficheros diminutos y leer el master entero era más lento que el CSV.
+MASTER_CSV = Path("data_processed/master_all_leagues.csv")
+MASTER_PARQUET = Path("data_processed/master_all_leagues.parquet")
+# Arrow IPC sin comprimir: se puede mapear en memoria y compartir entre procesos.
+# Cada versión va en su propio fichero (master_all_leagues.<versión>.arrow).
+MASTER_ARROW = Path("data_processed/master_all_leagues.arrow")
+# Dataset publicado: versión (hash del contenido), filas y fichero Arrow de esa
+# versión. Es lo último que escribe un build: cambiarlo es publicar.
+MASTER_MANIFEST = Path("data_processed/master_manifest.json")
+KEEP_ARROW_VERSIONS = 2
+
+ROW_GROUP_ROWS = 8192
+MANIFEST_NAME = "_manifest.json"
+NA_PARTITION = "__NA__"
+
+
+def _to_storable(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+
+    # Parquet/Arrow exigen un tipo por columna: las columnas de texto llegan mezcladas
+    # (p.ej. season "2018-19" en NBA y 2003 en NCAA), así que las pasamos a string.
+    for c in df.select_dtypes(include="object").columns:
+        df[c] = df[c].astype("string")
+    return df
+
+
+def _write_atomic(path: Path, write) -> None:
+    """Escribe vía fichero temporal + rename: los lectores nunca ven un fichero a medias."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def partition_key(league) -> str:
+    return NA_PARTITION if pd.isna(league) else str(league)
+
+
+def partition_path(league, root: Path = MASTER_PARQUET) -> Path:
+    return root / f"league={partition_key(league)}" / "part-0.parquet"
+
+
+def read_manifest(root: Path = MASTER_PARQUET) -> dict:
+    path = root / MANIFEST_NAME
+    if not path.exists():
+        return {"partitions": []}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_manifest(manifest: dict, root: Path = MASTER_PARQUET) -> None:
+    manifest = dict(manifest)
+    manifest["partitions"] = sorted(manifest["partitions"], key=lambda p: p["league"])
+    manifest["rows"] = sum(p["rows"] for p in manifest["partitions"])
+    manifest["updated_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    text = json.dumps(manifest, indent=2, ensure_ascii=False)
+    _write_atomic(root / MANIFEST_NAME, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+
+
+def master_schema(root: Path = MASTER_PARQUET) -> pa.Schema:
+    """Esquema Arrow común a todas las particiones (el de la primera del manifest)."""
+    first = read_manifest(root)["partitions"][0]
+    return pq.read_schema(root / first["path"])
+
+
+def conform(df: pd.DataFrame, schema: pa.Schema) -> pd.DataFrame:
+    """Columnas y tipos de df alineados con el esquema del dataset (para añadir particiones)."""
+    df = apply_schema(df.reindex(columns=schema.names))
+    for field in schema:
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            df[field.name] = df[field.name].astype("string")
+    return _to_storable(df)
+
+
+def write_partition(table: pa.Table, league, root: Path = MASTER_PARQUET) -> dict:
+    """Escribe (o reemplaza) la partición de una liga y devuelve su entrada del manifest."""
+    path = partition_path(league, root)
+    table = table.sort_by([("season_start_year", "ascending")])
+    _write_atomic(path, lambda tmp: pq.write_table(table, tmp, row_group_size=ROW_GROUP_ROWS))
+    return {
+        "league": partition_key(league),
+        "path": path.relative_to(root).as_posix(),
+        "rows": table.num_rows,
+    }
+
+
+def write_master_parquet(df: pd.DataFrame, path: Path = MASTER_PARQUET) -> Path:
+    """Escribe el master completo particionado por liga (sobrescribe)."""
+    # Un único esquema Arrow para todas las particiones (mismos tipos en cada fichero)
+    table = pa.Table.from_pandas(_to_storable(df), preserve_index=False)
+    leagues = df["league"].astype("string").fillna(NA_PARTITION)
+
+    # Se escribe entero en un directorio aparte y se cambia por el actual al final
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        shutil.rmtree(tmp)
+
+    partitions = []
+    for league, rows in leagues.groupby(leagues, sort=True).indices.items():
+        league = pd.NA if league == NA_PARTITION else league
+        partitions.append(write_partition(table.take(rows), league, tmp))
+    write_manifest({"columns": list(df.columns), "partitions": partitions}, tmp)
+
+    old = path.with_name(path.name + ".old")
+    if path.exists():
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    return path
+
+
+def partition_files(root: Path = MASTER_PARQUET, leagues: list | None = None) -> list[Path]:
+    """Ficheros de las particiones según el manifest (o recorriendo el directorio si no hay)."""
+    parts = read_manifest(root)["partitions"]
+    if not parts:
+        return sorted(root.rglob("*.parquet"))
+    return [root / p["path"] for p in parts if leagues is None or p["league"] in leagues]
+
+
+def read_master_parquet(path: Path = MASTER_PARQUET, leagues: list | None = None, columns: list | None = None) -> pd.DataFrame:
+    """Lee el dataset Parquet con los tipos ya guardados (sin coerción posterior)."""
+    files = [str(f) for f in partition_files(path, leagues)]
+    table = ds.dataset(files, format="parquet").to_table(columns=columns)
+    return table.to_pandas()
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def versioned_arrow(version: str, path: Path = MASTER_ARROW) -> Path:
+    """Fichero Arrow de una versión concreta del master."""
+    return path.with_name(f"{path.stem}.{version}{path.suffix}")
+
+
+def canonical_order(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Filas en un orden que solo depende del contenido: liga, temporada y hash de
+    la fila. El build completo y la ingesta llegan al mismo master con las filas
+    en distinto orden; así el fichero (y su hash) no cambia si el contenido no cambia.
+    """
+    keys = pd.DataFrame({
+        "league": df["league"].astype("string").to_numpy(),
+        "year": pd.to_numeric(df["season_start_year"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan),
+        "row": pd.util.hash_pandas_object(df, index=False).to_numpy(),
+    })
+    order = keys.sort_values(["league", "year", "row"], kind="stable").index.to_numpy()
+    return df.take(order).reset_index(drop=True)
+
+
+def write_master_arrow(df: pd.DataFrame, path: Path = MASTER_ARROW, manifest_path: Path = MASTER_MANIFEST) -> Path:
+    """
+    Escribe el master como un único fichero Arrow IPC sin comprimir (mapeable) y lo publica.
+
+    La versión es el hash del contenido (con los tipos del esquema y las filas en
+    orden canónico): el fichero se guarda con ella en el nombre (nunca se
+    sobrescribe uno que alguien pueda tener mapeado) y después se reescribe el
+    manifest. Un mismo master da siempre la misma versión, venga del build o de
+    una ingesta.
+    """
+    df = canonical_order(_to_storable(apply_schema(df)))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    version = _file_sha256(tmp)[:16]
+    target = versioned_arrow(version, path)
+    os.replace(tmp, target)
+    publish_master(version, target, table, manifest_path)
+    prune_arrow_versions(path, keep=target)
+    return target
+
+
+def publish_master(version: str, arrow_path: Path, table: pa.Table, manifest_path: Path = MASTER_MANIFEST) -> dict:
+    """Escribe (atómicamente) el manifest que apunta a la nueva versión del master."""
+    leagues = table.column("league").to_pandas().astype("string").fillna("UNKNOWN")
+    manifest = {
+        "version": version,
+        "arrow": arrow_path.name,
+        "rows": table.num_rows,
+        "rows_by_league": {k: int(v) for k, v in leagues.value_counts().sort_index().items()},
+        "columns": table.schema.names,
+        "published_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    text = json.dumps(manifest, indent=2, ensure_ascii=False)
+    _write_atomic(manifest_path, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+    return manifest
+
+
+def read_master_manifest(path: Path = MASTER_MANIFEST) -> dict | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def prune_arrow_versions(path: Path = MASTER_ARROW, keep: Path | None = None, n: int = KEEP_ARROW_VERSIONS) -> None:
+    """
+    Borra las copias Arrow antiguas: se conservan las `n` más recientes (la
+    anterior sigue mapeada por los procesos que aún no han visto la nueva
+    versión) y desaparece el fichero sin versión de builds anteriores.
+    """
+    versions = sorted(path.parent.glob(f"{path.stem}.*{path.suffix}"), key=lambda f: f.stat().st_mtime_ns, reverse=True)
+    stale = [f for f in versions[n:] if f != keep]
+    if path.exists():
+        stale.append(path)
+    for f in stale:
+        try:
+            f.unlink()
+        except OSError:
+            # Windows no deja borrar un fichero mapeado: ya se borrará en el próximo build
+            pass
+
+
+def read_master_arrow(path: Path = MASTER_ARROW) -> pd.DataFrame:
+    """
+    Abre el master mapeado en memoria (solo lectura).
+
+    Las columnas quedan respaldadas por los buffers Arrow del fichero (ArrowDtype),
+    así que no se copian datos al proceso: el SO comparte las páginas entre todos
+    los workers que abran el mismo fichero. Las columnas diccionario se convierten
+    a category (solo se materializan los códigos, int8/int16).
+    """
+    source = pa.memory_map(str(path), "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(types_mapper=_arrow_dtype)
+
+
+def _arrow_dtype(t: pa.DataType):
+    # None = conversión por defecto de pyarrow (diccionario -> pd.Categorical)
+    if pa.types.is_dictionary(t):
+        return None
+    return pd.ArrowDtype(t)
+
+
+def master_source(version: str | None = None) -> Path:
+    """
+    Fichero/dataset que usarán los loaders: Arrow (de esa versión), si no Parquet, si no CSV.
+
+    Una versión que ya no es la publicada y cuyo Arrow se ha borrado (prune) da
+    FileNotFoundError: el Parquet/CSV ya tienen otro contenido y la caché de esa
+    versión quedaría con datos que no son los suyos.
+    """
+    manifest = read_master_manifest()
+    if manifest is not None:
+        path = versioned_arrow(version or manifest["version"])
+        if path.exists():
+            return path
+        if version is not None and version != manifest["version"]:
+            raise FileNotFoundError(
+                f"La versión {version} del master ya no está disponible (publicada: {manifest['version']})"
+            )
+    for path in (MASTER_ARROW, MASTER_PARQUET):
+        if path.exists():
+            return path
+    return MASTER_CSV
+
+
+def master_version() -> str:
+    """
+    Versión del master publicado: la del manifest (hash del contenido).
+
+    Sin manifest (datos de antes del versionado, o solo el CSV) se usa una huella
+    barata (nombre, tamaño, mtime) de los ficheros.
+    """
+    manifest = read_master_manifest()
+    if manifest is not None:
+        return manifest["version"]
+
+    src = master_source()
+    files = sorted(src.rglob("*.parquet")) if src.is_dir() else [src]
+    h = hashlib.sha1()
+    for f in files:
+        if f.exists():
+            st = f.stat()
+            h.update(f"{f}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest()[:12]
@@ -0,0 +1,63 @@
+"""
+Tabla paginada para resultados grandes: solo se envía al navegador la página visible.
+
+El orden y el corte de la página los resuelve el motor de consultas (query.py),
+así que el tamaño de lo que se serializa en cada rerun no depende de lo amplios
+que sean los filtros.
+"""
+import math
+from dataclasses import replace
+
+import streamlit as st
+
+import perf
+from query import Query
+from utils import count_query, run_query
+
+PAGE_SIZES = [25, 50, 100, 250]
+DEFAULT_SORT_LABEL = "Temporada y puntos"
+
+
+def paged_table(
+    version: str,
+    base: Query,
+    columns: list[str],
+    default_sort: tuple,
+    key: str,
+    page_sizes: list[int] = PAGE_SIZES,
+) -> None:
+    """
+    Pinta `columns` de las filas de `base` página a página.
+
+    Orden: las columnas de `default_sort` (p.ej. el precalculado de la tabla) o
+    una columna elegida por el usuario; en ambos casos, ascendente o descendente
+    según el selector.
+    """
+    with perf.timer("table_count"):
+        total = count_query(version, base)
+
+    c1, c2, c3, c4 = st.columns([3, 2, 2, 2])
+    sort_col = c1.selectbox("Ordenar por", [DEFAULT_SORT_LABEL] + columns, key=f"{key}_sort")
+    descending = c2.radio("Orden", ["Desc", "Asc"], horizontal=True, key=f"{key}_dir") == "Desc"
+    page_size = c3.selectbox("Filas por página", page_sizes, key=f"{key}_size")
+    pages = max(1, math.ceil(total / page_size))
+    # Si los filtros dejan menos páginas, volvemos a la última que existe
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = c4.number_input("Página", min_value=1, max_value=pages, value=1, step=1, key=f"{key}_page")
+
+    # El sentido elegido se aplica también al orden por defecto (a todas sus columnas)
+    columns_sort = [c for c, _ in default_sort] if sort_col == DEFAULT_SORT_LABEL else [sort_col]
+    sort = tuple((c, not descending) for c in columns_sort)
+    start = (int(page) - 1) * page_size
+    with perf.timer("table_page"):
+        rows = run_query(version, replace(base, columns=tuple(columns), sort=sort, offset=start, limit=page_size))
+
+    with perf.timer("table_dataframe"):
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+    if total:
+        st.caption(
+            f"Filas {start + 1:,}–{start + len(rows):,} de {total:,} · página {int(page)} de {pages}".replace(",", ".")
+        )
+    else:
+        st.caption("Sin filas para estos filtros")
@@ -1,11 +1,45 @@
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-MASTER_ALL = Path("data_processed/master_all_leagues.csv")
+import perf
+from schema import apply_schema
+from store import (
+    MASTER_CSV, MASTER_PARQUET,
+    master_source, master_version, read_master_arrow, read_master_parquet,
+)
+
+if TYPE_CHECKING:
+    from figures import FigureCache
+    from indexes import FilterIndex, PlayerIndex
+    from query import Query
+
+MASTER_ALL = MASTER_CSV
+
+# Los módulos de índices, consultas y figuras se importan dentro de cada función:
+# cada página solo carga lo que usa (p.ej. Jugador no necesita el motor de consultas).
+# perf.timed va debajo de la caché: mide el trabajo real (fallos de caché), no los aciertos.
+
+# Todas las cachés del dataset van por versión (manifest del build, ver store.py).
+# max_entries=1: cuando se publica un build nuevo, la primera sesión que lo ve
+# carga la versión nueva y la anterior sale de la caché en ese momento, sin
+# reiniciar la app y sin dos masters en memoria más tiempo del necesario.
+
+
+def dataset_version() -> str:
+    """Versión del master publicado; clave de todas las cachés de datos (master, índices, figuras...)."""
+    return master_version()
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+@perf.timed("load_master")
+def load_master(version: str) -> pd.DataFrame:
+    # Preferimos la copia columnar: ya viene tipada y no hay que parsear texto
+    if MASTER_PARQUET.exists():
+        return read_master_parquet(MASTER_PARQUET)
 
-@st.cache_data(show_spinner=False)
-def load_master() -> pd.DataFrame:
     df = pd.read_csv(MASTER_ALL)
 
     # Seguridad: columnas clave
@@ -14,18 +48,99 @@ def load_master() -> pd.DataFrame:
     if "lg" not in df.columns:
         df["lg"] = df["league"]
 
-    # Tipos (para sliders/ordenaciones)
-    num_cols = [
-        "season_start_year", "age", "g", "mp_per_game",
-        "pts_per_game", "ast_per_game", "trb_per_game",
-        "orb_per_game", "drb_per_game",
-        "stl_per_game", "blk_per_game", "tov_per_game", "pf_per_game",
-        "fg_percent", "x3p_percent", "ft_percent",
-        "draft_year", "draft_round", "draft_pick",
-        "career_year", "rookie_season_start_year",
-    ]
-    for c in num_cols:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce")
-
-    return df
+    # Tipos (para sliders/ordenaciones): mismo esquema compacto que el build
+    return apply_schema(df)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+@perf.timed("load_master_shared")
+def load_master_shared(version: str) -> pd.DataFrame:
+    """
+    Master de solo lectura compartido por todas las sesiones del proceso.
+
+    A diferencia de load_master (st.cache_data copia el DataFrame en cada acceso),
+    aquí se devuelve siempre el mismo objeto, respaldado por el fichero Arrow
+    (el de esa versión) mapeado en memoria. Las páginas NO deben modificarlo en
+    sitio: usar assign/merge/filtrados, que devuelven un DataFrame nuevo.
+    """
+    src = master_source(version)
+    if src.suffix == ".arrow":
+        return read_master_arrow(src)
+    return load_master(version)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+@perf.timed("filter_index")
+def get_filter_index(version: str) -> "FilterIndex":
+    """Índice de filtros de PandasEngine (query.py), uno por versión del dataset y proceso."""
+    from indexes import FilterIndex
+
+    return FilterIndex(load_master_shared(version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+@perf.timed("player_index")
+def get_player_index(version: str) -> "PlayerIndex":
+    """Índice de filas por jugador (Jugador y comparativas del Draft)."""
+    from indexes import PlayerIndex
+
+    return PlayerIndex(load_master_shared(version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+@perf.timed("query_engine")
+def get_query_engine(version: str):
+    """
+    Motor de consultas de las páginas (query.py): pandas sobre el master
+    compartido y su índice de filtros (Arrow sobre el fichero de la versión si
+    DASHBOARD_ENGINE=arrow).
+    """
+    from query import make_engine
+
+    return make_engine(
+        lambda: load_master_shared(version), lambda: get_filter_index(version), master_source(version),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+@perf.timed("run_query")
+def run_query(version: str, query: "Query") -> pd.DataFrame:
+    """Resultado de un Query (hashable), cacheado por versión del dataset."""
+    return get_query_engine(version).run(query)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+@perf.timed("count_query")
+def count_query(version: str, query: "Query") -> int:
+    """Número de filas que devuelve un Query sin límite (para paginar)."""
+    return get_query_engine(version).count(query)
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache() -> "FigureCache":
+    """Caché de figuras Plotly del proceso (figures.py); la versión va en cada clave."""
+    from figures import FigureCache
+
+    return FigureCache()
+
+
+def cached_figure(version: str, chart: str, build, **params):
+    """Figura de `chart` con estos parámetros, construida con `build()` solo si no está en caché."""
+    from figures import figure_key
+
+    def timed_build():
+        with perf.timer(f"figure_build:{chart}"):
+            return build()
+
+    with perf.timer(f"figure:{chart}"):
+        return get_figure_cache().get(figure_key(version, chart, **params), timed_build)
+
+
+def category_options(s: pd.Series) -> list:
+    """Valores presentes de una columna, ordenados (sobre los códigos si es category)."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        used = np.unique(codes[codes >= 0])
+        return sorted(s.cat.categories[used].tolist())
+    return sorted(s.dropna().unique().tolist())
+
@@ -0,0 +1,130 @@
+"""
+Precalentado de cachés al arrancar el servidor.
+
+Sin esto, el primer usuario que abre una página paga la carga del master, el
+motor de consultas (con sus índices) y la primera consulta del Explorador.
+serve.py lanza warm_up() en un hilo en cuanto arranca Streamlit; al terminar se
+escribe el marcador de la instancia (marker_path(puerto)) y el healthcheck
+(scripts/healthcheck.py) empieza a darla por lista. Hay un marcador por puerto
+(varias réplicas pueden compartir data_processed/) y se reinicia a "warming" en
+cada arranque, así que nunca vale el de otra instancia ni el de un arranque anterior.
+
+Se rellenan las mismas cachés que usan las páginas (utils.py), con las mismas
+consultas que lanza la vista inicial del Explorador: NBA, 2000 -> última
+temporada, mínimo 20 partidos, top 20 de pts_per_game.
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from streamlit import runtime
+
+from figures import top_bar
+from query import (
+    EXPLORER_FIRST_YEAR, EXPLORER_LEAGUES, EXPLORER_MIN_GAMES, EXPLORER_TOP_N,
+    KPI_COLUMNS, RANK_METRICS, TABLE_COLUMNS, TABLE_SORT, TOP_COLUMNS, Query,
+)
+from table import PAGE_SIZES
+from utils import (
+    cached_figure, category_options, count_query, dataset_version,
+    get_player_index, get_query_engine, load_master_shared, run_query,
+)
+
+MARKER_DIR = Path("data_processed")
+DEFAULT_PORT = 8501
+RUNTIME_TIMEOUT = 60
+
+
+def explorer_default_view(version: str) -> None:
+    """Consultas (y figura) de la vista inicial del Explorador, igual que pages/1_Explorador.py."""
+    engine = get_query_engine(version)
+    idx = engine.options
+    metric = RANK_METRICS[0]
+
+    base = Query(
+        leagues=tuple(l for l in EXPLORER_LEAGUES if l in idx.lg),
+        year_range=(EXPLORER_FIRST_YEAR, idx.max_year),
+        min_games=EXPLORER_MIN_GAMES,
+    )
+    f = run_query(version, replace(base, columns=KPI_COLUMNS))
+
+    seasons = category_options(f["season"])[::-1] if len(f) else []
+    if seasons:
+        season = seasons[0]
+        top = run_query(version, replace(
+            base, season=season, columns=(*TOP_COLUMNS, metric), sort=((metric, False),), limit=EXPLORER_TOP_N,
+        ))
+        cached_figure(
+            version, "top_bar", lambda: top_bar(top, metric),
+            query=base, season=season, metric=metric, top_n=EXPLORER_TOP_N,
+        )
+
+    # Primera página de la tabla (table.paged_table con su orden y tamaño por defecto)
+    cols = tuple(c for c in TABLE_COLUMNS if c in engine.columns)
+    count_query(version, base)
+    run_query(version, replace(base, columns=cols, sort=TABLE_SORT, offset=0, limit=PAGE_SIZES[0]))
+
+
+def warm_up() -> dict:
+    """Carga el master y sus derivados de la versión publicada; devuelve los tiempos por paso."""
+    # st.cache_data necesita el runtime del servidor (si no, usaría una caché aparte)
+    deadline = time.monotonic() + RUNTIME_TIMEOUT
+    while not runtime.exists():
+        if time.monotonic() > deadline:
+            raise TimeoutError("El runtime de Streamlit no ha arrancado")
+        time.sleep(0.1)
+
+    version = dataset_version()
+    steps = [
+        ("master", lambda: load_master_shared(version)),
+        # El motor construye lo que usa: FilterIndex + RankIndex (pandas) o nada (Arrow)
+        ("query_engine", lambda: get_query_engine(version)),
+        ("player_index", lambda: get_player_index(version)),
+        ("explorer", lambda: explorer_default_view(version)),
+    ]
+    timings = {}
+    for name, step in steps:
+        t0 = time.perf_counter()
+        step()
+        timings[name] = round(time.perf_counter() - t0, 3)
+    return {"version": version, "seconds": timings}
+
+
+def marker_path(port: int = DEFAULT_PORT) -> Path:
+    """Marcador de precalentado de la instancia que sirve en `port`."""
+    return MARKER_DIR / f".warmup.{port}.json"
+
+
+def write_marker(status: dict, path: Path) -> None:
+    status = {**status, "pid": os.getpid(), "at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(status, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_marker(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def start_warmup(port: int = DEFAULT_PORT) -> threading.Thread:
+    """Lanza warm_up() en segundo plano; el marcador pasa de "warming" a "ready" (o "error")."""
+    path = marker_path(port)
+    # Lo primero es pisar el marcador que pudiera quedar de un arranque anterior en este puerto
+    write_marker({"status": "warming", "port": port}, path)
+
+    def run() -> None:
+        try:
+            write_marker({"status": "ready", "port": port, **warm_up()}, path)
+        except Exception as e:
+            write_marker({"status": "error", "port": port, "error": f"{type(e).__name__}: {e}"}, path)
+
+    thread = threading.Thread(target=run, name="warmup", daemon=True)
+    thread.start()
+    return thread
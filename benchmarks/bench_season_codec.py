@@ -0,0 +1,82 @@
+"""
+Benchmark: parseo de temporadas fila a fila (.apply) vs season_codec vectorizado.
+
+Usa el histórico NBA por partido (Kaggle sumitrodatta) si está en data_raw/;
+si no, una columna sintética del mismo tamaño y cardinalidad.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_season_codec.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from season_codec import season_label, season_start_year  # noqa: E402
+
+NBA_PER_GAME = Path("data_raw/kaggle/sumitrodatta/Player Per Game.csv")
+REPEAT = 5
+
+
+def parse_season_start(season_val):
+    """Implementación anterior (postprocess_master_csv.py), fila a fila."""
+    if pd.isna(season_val):
+        return None
+    s = str(season_val).strip()
+    if "-" in s:
+        try:
+            return int(s.split("-")[0])
+        except Exception:
+            return None
+    try:
+        return int(float(s))
+    except Exception:
+        return None
+
+
+def load_seasons() -> tuple[pd.Series, str]:
+    if NBA_PER_GAME.exists():
+        years = pd.read_csv(NBA_PER_GAME, usecols=["season"])["season"]
+        return season_label(years), f"{NBA_PER_GAME} ({len(years)} filas)"
+    # ~32k filas entre 1947 y 2025, como el histórico real
+    rng = np.random.default_rng(0)
+    years = pd.Series(rng.integers(1947, 2026, size=32_000))
+    return season_label(years), f"sintético ({len(years)} filas, 1947-2025)"
+
+
+def best_of(fn, repeat: int = REPEAT) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    labels, source = load_seasons()
+    starts = season_start_year(labels)
+    print(f"Datos: {source}\n")
+
+    # Mismo resultado que la versión anterior
+    old = labels.apply(parse_season_start)
+    assert (old.astype("Int64") == starts).all(), "season_start_year no coincide con parse_season_start"
+    old_labels = starts.apply(lambda y: f"{int(y)}-{str(int(y)+1)[-2:]}" if pd.notna(y) else pd.NA)
+    assert (old_labels.astype("string") == season_label(starts)).all(), "season_label no coincide"
+
+    cases = [
+        ("'YYYY-YY' -> año", lambda: labels.apply(parse_season_start), lambda: season_start_year(labels)),
+        ("año -> 'YYYY-YY'", lambda: starts.apply(lambda y: f"{int(y)}-{str(int(y)+1)[-2:]}" if pd.notna(y) else pd.NA),
+         lambda: season_label(starts)),
+    ]
+    print(f"{'caso':<20} {'apply (ms)':>12} {'codec (ms)':>12} {'speedup':>9}")
+    for name, slow, fast in cases:
+        t_slow, t_fast = best_of(slow), best_of(fast)
+        print(f"{name:<20} {t_slow * 1e3:>12.2f} {t_fast * 1e3:>12.2f} {t_slow / t_fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Arranque en frío de las páginas del dashboard: qué módulos importa cada página
+(y cuánto tardan) y cuánto tarda su primer render.
+
+Cada página se ejecuta en un proceso nuevo (como una réplica recién arrancada,
+sin cachés) con `python -X importtime` y streamlit.testing.AppTest. Los imports
+de AppTest/Streamlit se hacen antes de medir, así que lo que se reporta es lo
+que añade la página.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/profile_startup.py
+    python benchmarks/profile_startup.py --pages app/pages/3_Jugador.py --top 20
+    python benchmarks/profile_startup.py --json startup.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PAGES = [Path("app/Home.py"), *sorted(Path("app/pages").glob("*.py"))]
+MARK = "@@page@@"
+TOP = 10
+
+# Se ejecuta en el proceso hijo: argv[1] = página
+CHILD = f"""
+import json, sys, time
+sys.path.insert(0, "app")
+from streamlit.testing.v1 import AppTest
+print({MARK!r}, file=sys.stderr, flush=True)
+t0 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300).run()
+print(json.dumps({{"first_render": time.perf_counter() - t0, "exceptions": [e.value for e in at.exception]}}))
+"""
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Líneas de -X importtime posteriores a la marca: módulo, tiempo propio y acumulado (ms), nivel."""
+    lines = stderr.splitlines()
+    start = lines.index(MARK) + 1 if MARK in lines else 0
+    rows = []
+    for line in lines[start:]:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            "level": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1e3,
+            "cumulative_ms": int(cumulative_us) / 1e3,
+        })
+    return rows
+
+
+def profile_page(page: Path) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD, str(page)],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{page}: el proceso terminó con {proc.returncode}\n{proc.stderr[-2000:]}")
+
+    imports = parse_importtime(proc.stderr)
+    top_level = [r for r in imports if r["level"] == 0]
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {
+        "page": page.as_posix(),
+        "first_render_s": round(result["first_render"], 3),
+        "import_ms": round(sum(r["cumulative_ms"] for r in top_level), 1),
+        "modules": len(imports),
+        "exceptions": result["exceptions"],
+        "top_imports": sorted(top_level, key=lambda r: r["cumulative_ms"], reverse=True),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perfil de arranque en frío de las páginas del dashboard.")
+    parser.add_argument("--pages", nargs="+", type=Path, default=PAGES)
+    parser.add_argument("--top", type=int, default=TOP, help=f"Módulos más lentos a mostrar por página (por defecto {TOP})")
+    parser.add_argument("--json", type=Path, default=None, help="Guarda el resultado completo en este fichero")
+    args = parser.parse_args()
+
+    results = []
+    for page in args.pages:
+        r = profile_page(page)
+        results.append(r)
+
+        print(f"\n{r['page']}: primer render {r['first_render_s']:.2f}s | "
+              f"imports {r['import_ms']:.0f} ms ({r['modules']} módulos)")
+        if r["exceptions"]:
+            print(f"  ¡excepciones!: {r['exceptions']}")
+        for m in r["top_imports"][:args.top]:
+            print(f"  {m['cumulative_ms']:>9.1f} ms  {m['module']}")
+
+    print(f"\n{'página':<32} {'imports (ms)':>13} {'1er render (s)':>15}")
+    for r in results:
+        print(f"{r['page']:<32} {r['import_ms']:>13.0f} {r['first_render_s']:>15.2f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nGuardado: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Benchmarks del pipeline y de las consultas del dashboard sobre datos sintéticos.
+
+Para cada escala (1 = tamaño del master real, 10 = 10x filas, ...) genera las
+entradas en un directorio temporal (benchmarks/synthetic.py), se sitúa en él
+(los scripts usan rutas relativas a la raíz) y mide:
+
+    pipeline   WNBA (merge + normalize), NCAA normalize, build del master,
+               escritura Parquet/Arrow
+    carga      load_master por CSV, Parquet y Arrow
+    consultas  vista inicial del Explorador (filtros + top-N + tabla) con los
+               motores pandas y Arrow, búsqueda de jugador y filtros del Draft
+
+Cada caso se repite y se guarda el mejor tiempo y la mediana. El resultado va
+a un JSON (por defecto benchmarks/results/<commit>.json) para comparar commits
+en la misma máquina con --compare.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/run_benchmarks.py                 # escalas 1 y 10
+    python benchmarks/run_benchmarks.py --scales 1 10 100
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/abc1234.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "app"))
+from build_master_all_leagues import NBA_PATH, NCAA_PATH, WNBA_PATH, combine_leagues, load_csv  # noqa: E402
+from indexes import FilterIndex, PlayerIndex  # noqa: E402
+from league_normalizer import NCAA, WNBA, normalize, read_league  # noqa: E402
+from merge_wnba import read_season, season_files  # noqa: E402
+from query import (  # noqa: E402
+    EXPLORER_FIRST_YEAR, EXPLORER_LEAGUES, EXPLORER_MIN_GAMES, EXPLORER_TOP_N,
+    KPI_COLUMNS, RANK_METRICS, TABLE_COLUMNS, TABLE_SORT, TOP_COLUMNS,
+    ArrowEngine, PandasEngine, Query,
+)
+from schema import apply_schema, player_keys  # noqa: E402
+from store import (  # noqa: E402
+    MASTER_ARROW, MASTER_CSV, MASTER_MANIFEST, MASTER_PARQUET,
+    read_master_arrow, read_master_parquet, versioned_arrow, write_master_arrow, write_master_parquet,
+)
+from synthetic import write_workspace  # noqa: E402
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+REPEAT = 3
+PAGE_SIZE = 25
+LOOKUPS = 200
+
+
+def measure(fn, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {"best_s": round(min(times), 5), "median_s": round(statistics.median(times), 5), "repeat": repeat}
+
+
+def explorer_view(engine, max_year: int) -> None:
+    """Consultas de la vista inicial del Explorador (KPIs, top-N de la última temporada, 1ª página)."""
+    metric = RANK_METRICS[0]
+    base = Query(leagues=EXPLORER_LEAGUES, year_range=(EXPLORER_FIRST_YEAR, max_year), min_games=EXPLORER_MIN_GAMES)
+    f = engine.run(replace(base, columns=KPI_COLUMNS))
+    season = f["season"].dropna().astype("string").max()
+    engine.run(replace(base, season=season, columns=(*TOP_COLUMNS, metric), sort=((metric, False),), limit=EXPLORER_TOP_N))
+    engine.count(base)
+    cols = tuple(c for c in TABLE_COLUMNS if c in engine.columns)
+    engine.run(replace(base, columns=cols, sort=TABLE_SORT, offset=0, limit=PAGE_SIZE))
+
+
+def draft_filters(df: pd.DataFrame, years: np.ndarray, picks: np.ndarray) -> None:
+    """Los dos filtros de la página Draft y Picks (año de draft; rango de años + pick)."""
+    for year, pick in zip(years, picks):
+        df[df["draft_year"] == year].drop_duplicates(subset=["player_name"])
+        f = df[(df["draft_year"] >= EXPLORER_FIRST_YEAR) & (df["draft_year"] <= year)]
+        f[f["draft_pick"] == pick].drop_duplicates(subset=["player_name"])
+
+
+def run_scale(repeat: int) -> dict:
+    results: dict = {}
+
+    def bench(name: str, fn, rows: int | None = None) -> None:
+        results[name] = {**measure(fn, repeat), **({"rows": rows} if rows is not None else {})}
+        print(f"  {name:<28} {results[name]['best_s'] * 1e3:>10.1f} ms")
+
+    # --- Pipeline ---
+    files = season_files()
+    wnba = pd.concat([read_season(path, season) for season, path in files], ignore_index=True)
+    bench("wnba_merge", lambda: [read_season(path, season) for season, path in files], len(wnba))
+    bench("wnba_normalize", lambda: normalize(WNBA, wnba), len(wnba))
+    ncaa_path = Path("data_raw/ncaa/ncaa-stats-complete.csv")
+    bench("ncaa_normalize", lambda: normalize(NCAA, read_league(NCAA, ncaa_path)))
+
+    leagues = [(NBA_PATH, "NBA"), (WNBA_PATH, "WNBA"), (NCAA_PATH, "NCAA")]
+    frames = [load_csv(path, league) for path, league in leagues]
+    master = combine_leagues(frames)
+    rows = len(master)
+    bench("master_load_inputs", lambda: [load_csv(path, league) for path, league in leagues], rows)
+    bench("master_combine", lambda: combine_leagues(frames), rows)
+    bench("master_apply_schema", lambda: apply_schema(master), rows)
+    typed = apply_schema(master)
+    bench("master_write_csv", lambda: master.to_csv(MASTER_CSV, index=False), rows)
+    bench("master_write_parquet", lambda: write_master_parquet(typed, MASTER_PARQUET), rows)
+    bench("master_write_arrow", lambda: write_master_arrow(typed, MASTER_ARROW, MASTER_MANIFEST), rows)
+    arrow_path = versioned_arrow(json.loads(MASTER_MANIFEST.read_text(encoding="utf-8"))["version"])
+
+    # --- Carga (load_master / load_master_shared) ---
+    # Igual que load_master: read_csv sin dtype (el aviso de tipos mixtos es esperado)
+    warnings.simplefilter("ignore", pd.errors.DtypeWarning)
+    bench("load_master_csv", lambda: apply_schema(pd.read_csv(MASTER_CSV)), rows)
+    bench("load_master_parquet", lambda: read_master_parquet(MASTER_PARQUET), rows)
+    bench("load_master_arrow", lambda: read_master_arrow(arrow_path), rows)
+
+    # --- Consultas del dashboard ---
+    df = read_master_arrow(arrow_path)
+    max_year = int(pd.to_numeric(df["season_start_year"], errors="coerce").max())
+    bench("filter_index_build", lambda: FilterIndex(df), rows)
+    index = FilterIndex(df)
+    bench("pandas_engine_build", lambda: PandasEngine(df, index), rows)
+    pandas_engine = PandasEngine(df, index)
+    bench("explorer_view_pandas", lambda: explorer_view(pandas_engine, max_year), rows)
+    bench("arrow_engine_build", lambda: ArrowEngine(arrow_path), rows)
+    arrow_engine = ArrowEngine(arrow_path)
+    bench("explorer_view_arrow", lambda: explorer_view(arrow_engine, max_year), rows)
+
+    bench("player_index_build", lambda: PlayerIndex(df), rows)
+    pidx = PlayerIndex(df)
+    rng = np.random.default_rng(0)
+    keys = rng.choice(player_keys(df).dropna().unique(), size=LOOKUPS)
+    bench(f"player_lookup_x{LOOKUPS}", lambda: [df.take(pidx.rows([k])) for k in keys], rows)
+
+    draft_years = pd.to_numeric(df["draft_year"], errors="coerce").dropna().astype(int)
+    years = rng.choice(draft_years.unique(), size=20)
+    picks = rng.integers(1, 31, size=20)
+    bench("draft_filters_x20", lambda: draft_filters(df, years, picks), rows)
+    return results
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict, previous: dict) -> None:
+    print(f"\nComparación con {previous['commit']} (>1 = más rápido ahora)")
+    for scale, cases in current["scales"].items():
+        old = previous["scales"].get(scale, {})
+        print(f"escala {scale}x")
+        for name, r in cases.items():
+            if name in old:
+                print(f"  {name:<28} {old[name]['best_s'] * 1e3:>10.1f} -> {r['best_s'] * 1e3:>10.1f} ms"
+                      f"  {old[name]['best_s'] / r['best_s']:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del pipeline y de las consultas del dashboard.")
+    parser.add_argument("--scales", nargs="+", type=float, default=[1, 10], help="Multiplicadores de filas (por defecto 1 10)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--out", type=Path, default=None, help="JSON de salida (por defecto benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON de una ejecución anterior con el que comparar")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "scales": {},
+    }
+
+    cwd = Path.cwd()
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory(prefix="basket_bench_") as tmp:
+            t0 = time.perf_counter()
+            rows = write_workspace(Path(tmp), scale)
+            print(f"\nEscala {scale:g}x: {sum(rows.values())} filas {rows} (datos generados en {time.perf_counter() - t0:.1f}s)")
+            os.chdir(tmp)
+            try:
+                report["scales"][f"{scale:g}"] = run_scale(args.repeat)
+            finally:
+                os.chdir(cwd)
+
+    out = args.out or RESULTS_DIR / f"{commit}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nGuardado: {out}")
+
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Datos sintéticos con el esquema del master para los benchmarks.
+
+A escala 1 el tamaño es el del master real (NBA ~32k filas, WNBA ~5k, NCAA
+~16k); `scale` multiplica las filas de las tres ligas. Los jugadores tienen
+carreras de temporadas consecutivas (para que rookie/career_year y el índice
+por jugador trabajen como con datos reales) y la cardinalidad de equipos,
+posiciones, temporadas y drafts es la del histórico.
+
+Se generan los ficheros de entrada de cada etapa con la misma estructura de
+carpetas que el proyecto (write_workspace):
+
+    data_raw/wnba/<año>.csv                 export de Basketball-Reference
+    data_raw/ncaa/ncaa-stats-complete.csv   dataset NCAA de Kaggle
+    data_processed/<liga>_master_ready.csv  entradas del build del master
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+from merge_wnba import EXPECTED_HEADER  # noqa: E402
+from schema import CORE_COLS  # noqa: E402
+from season_codec import YEAR, season_label  # noqa: E402
+
+BASE_ROWS = {"NBA": 32_000, "WNBA": 5_000, "NCAA": 16_000}
+FIRST_YEAR = {"NBA": 1947, "WNBA": 1997, "NCAA": 2003}
+LAST_YEAR = 2025
+N_TEAMS = {"NBA": 30, "WNBA": 13}
+POSITIONS = ["PG", "SG", "SF", "PF", "C", "G", "F"]
+CLASSES = ["Fr", "So", "Jr", "Sr"]
+COLLEGES = [f"College {i}" for i in range(300)]
+
+STATS = {
+    # columna master: (media, desviación) por partido
+    "mp_per_game": (20.0, 9.0),
+    "pts_per_game": (8.0, 6.0),
+    "ast_per_game": (1.8, 1.6),
+    "trb_per_game": (3.6, 2.5),
+    "orb_per_game": (1.0, 0.8),
+    "drb_per_game": (2.6, 1.8),
+    "stl_per_game": (0.7, 0.4),
+    "blk_per_game": (0.4, 0.4),
+    "tov_per_game": (1.2, 0.8),
+    "pf_per_game": (1.9, 0.8),
+    "fg_per_game": (3.1, 2.2),
+    "fga_per_game": (6.9, 4.5),
+    "x3p_per_game": (0.7, 0.8),
+    "x3pa_per_game": (2.0, 2.0),
+    "ft_per_game": (1.4, 1.3),
+    "fta_per_game": (1.9, 1.6),
+}
+PERCENTS = ["fg_percent", "x3p_percent", "ft_percent"]
+
+
+def careers(league: str, n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Filas (jugador, temporada) con carreras consecutivas hasta sumar n_rows."""
+    length = rng.integers(1, 4 if league == "NCAA" else 15, size=n_rows)
+    length = length[: np.searchsorted(np.cumsum(length), n_rows) + 1]
+    length[-1] -= length.sum() - n_rows
+
+    first, last = FIRST_YEAR[league], LAST_YEAR
+    rookie = rng.integers(first, last + 1, size=len(length))
+    player = np.repeat(np.arange(len(length)), length)
+    offset = np.arange(n_rows) - np.repeat(np.cumsum(length) - length, length)
+    # Carreras que se pasarían de la última temporada se desplazan hacia atrás
+    start = np.minimum(rookie, last - length + 1).clip(first)
+    year = np.repeat(start, length) + offset
+    return pd.DataFrame({"player": player, "season_start_year": year, "career": offset})
+
+
+def master_ready(league: str, n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Un <liga>_master_ready.csv sintético (columnas CORE_COLS de esa liga)."""
+    c = careers(league, n_rows, rng)
+    df = pd.DataFrame(index=c.index).assign(league=league, lg=league)
+    df["season_start_year"] = c["season_start_year"]
+    df["player_name"] = league + " Player " + c["player"].astype(str)
+
+    if league == "NCAA":
+        df["season"] = season_label(df["season_start_year"], YEAR)
+        df["class"] = np.array(CLASSES)[c["career"].clip(upper=3)]
+    else:
+        df["season"] = season_label(df["season_start_year"])
+        df["team"] = [f"T{t:02d}" for t in rng.integers(0, N_TEAMS[league], size=n_rows)]
+        df["pos"] = np.array(POSITIONS)[rng.integers(0, len(POSITIONS), size=n_rows)]
+        df["age"] = 20 + c["career"] + rng.integers(0, 3, size=n_rows)
+
+    df["g"] = rng.integers(1, 83 if league == "NBA" else 41, size=n_rows)
+    for col, (mean, sd) in STATS.items():
+        df[col] = np.round(np.abs(rng.normal(mean, sd, size=n_rows)), 1)
+    for col in PERCENTS:
+        df[col] = np.round(rng.uniform(0.2, 0.9, size=n_rows), 3)
+
+    if league == "NBA":
+        n_players = int(c["player"].max()) + 1
+        df["player_id"] = "p" + c["player"].astype(str).str.zfill(7)
+        drafted = rng.random(n_players) < 0.7
+        rookie_year = c.groupby("player")["season_start_year"].min().to_numpy()
+        draft = pd.DataFrame({
+            "draft_year": np.where(drafted, rookie_year, np.nan),
+            "draft_round": np.where(drafted, rng.integers(1, 3, size=n_players), np.nan),
+            "draft_pick": np.where(drafted, rng.integers(1, 61, size=n_players), np.nan),
+            "draft_team": np.where(drafted, [f"T{t:02d}" for t in rng.integers(0, 30, size=n_players)], None),
+            "college": np.where(drafted, np.array(COLLEGES)[rng.integers(0, len(COLLEGES), size=n_players)], None),
+        })
+        for col in draft.columns:
+            df[col] = draft[col].to_numpy()[c["player"]]
+
+    return df[[col for col in CORE_COLS + ["class"] if col in df.columns]]
+
+
+def wnba_seasons(n_rows: int, rng: np.random.Generator) -> dict[int, pd.DataFrame]:
+    """Exports por temporada de la WNBA (cabecera EXPECTED_HEADER, con G/MP duplicados)."""
+    m = master_ready("WNBA", n_rows, rng)
+    out = pd.DataFrame({
+        "Player": m["player_name"], "Team": m["team"], "Pos": m["pos"],
+        "G": m["g"], "MP": (m["mp_per_game"] * m["g"]).round(0),
+        "G.1": m["g"], "GS": (m["g"] * rng.random(n_rows)).astype(int), "MP.1": m["mp_per_game"],
+        "FG": m["fg_per_game"], "FGA": m["fga_per_game"], "FG%": m["fg_percent"],
+        "3P": m["x3p_per_game"], "3PA": m["x3pa_per_game"], "3P%": m["x3p_percent"],
+        "2P": m["fg_per_game"] - m["x3p_per_game"], "2PA": m["fga_per_game"] - m["x3pa_per_game"],
+        "2P%": m["fg_percent"],
+        "FT": m["ft_per_game"], "FTA": m["fta_per_game"], "FT%": m["ft_percent"],
+        "ORB": m["orb_per_game"], "TRB": m["trb_per_game"], "AST": m["ast_per_game"],
+        "STL": m["stl_per_game"], "BLK": m["blk_per_game"], "TOV": m["tov_per_game"],
+        "PF": m["pf_per_game"], "PTS": m["pts_per_game"],
+    })
+    out.columns = EXPECTED_HEADER
+    return {int(year): g for year, g in out.groupby(m["season_start_year"].to_numpy())}
+
+
+def ncaa_raw(n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """ncaa-stats-complete.csv sintético (columnas del dataset de Kaggle)."""
+    m = master_ready("NCAA", n_rows, rng)
+    return pd.DataFrame({
+        "player": m["player_name"], "cls": m["class"], "year": m["season_start_year"], "gp": m["g"],
+        "mpg": m["mp_per_game"], "ppg": m["pts_per_game"],
+        "fgm": m["fg_per_game"], "fga": m["fga_per_game"], "fg%": m["fg_percent"],
+        "3pm": m["x3p_per_game"], "3pa": m["x3pa_per_game"], "3p%": m["x3p_percent"],
+        "ftm": m["ft_per_game"], "fta": m["fta_per_game"], "ft%": m["ft_percent"],
+        "orb": m["orb_per_game"], "drb": m["drb_per_game"], "rpg": m["trb_per_game"],
+        "apg": m["ast_per_game"], "spg": m["stl_per_game"], "bpg": m["blk_per_game"],
+        "tov": m["tov_per_game"], "pf": m["pf_per_game"],
+    })
+
+
+def write_workspace(root: Path, scale: float = 1, seed: int = 0) -> dict[str, int]:
+    """Escribe en `root` las entradas de todas las etapas a esa escala; devuelve filas por liga."""
+    rng = np.random.default_rng(seed)
+    rows = {league: int(n * scale) for league, n in BASE_ROWS.items()}
+
+    raw, processed = root / "data_raw", root / "data_processed"
+    (raw / "wnba").mkdir(parents=True, exist_ok=True)
+    (raw / "ncaa").mkdir(parents=True, exist_ok=True)
+    processed.mkdir(parents=True, exist_ok=True)
+
+    for year, season in wnba_seasons(rows["WNBA"], rng).items():
+        season.to_csv(raw / "wnba" / f"{year}.csv", index=False)
+    ncaa_raw(rows["NCAA"], rng).to_csv(raw / "ncaa" / "ncaa-stats-complete.csv", index=False)
+    for league, n in rows.items():
+        master_ready(league, n, rng).to_csv(processed / f"{league.lower()}_master_ready.csv", index=False)
+    return rows
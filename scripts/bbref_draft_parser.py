@@ -0,0 +1,111 @@
+"""
+Parser dirigido de la tabla de draft de Basketball-Reference (draft/NBA_<año>.html).
+
+En vez de pd.read_html sobre la página entera (todas las tablas), se recorta
+solo el fragmento <table id="stats">...</table> y se recorre con el HTMLParser
+de la librería estándar. Las columnas se identifican por su atributo data-stat,
+así que la cabecera de dos niveles no importa. Las filas separadoras
+("Round 2", ...) marcan la ronda de los picks que siguen.
+"""
+import re
+from html.parser import HTMLParser
+
+import pandas as pd
+
+DRAFT_TABLE_ID = "stats"
+
+# data-stat -> esquema draft_* del master
+DATA_STAT_RENAME = {
+    "pick_overall": "draft_pick",
+    "team_id": "draft_team",
+    "player": "player_name",
+    "college_name": "college",
+}
+DRAFT_COLS = ["draft_year", "draft_round", "draft_pick", "draft_team", "player_name", "player_id", "college"]
+
+ROUND_RE = re.compile(r"Round\s+(\d+)", re.IGNORECASE)
+PLAYER_HREF_RE = re.compile(r"^/players/\w/([\w.]+)\.html")
+
+
+def table_fragment(html: str, table_id: str = DRAFT_TABLE_ID) -> str | None:
+    """Solo el HTML de la tabla pedida (o None si la página no la tiene)."""
+    at = html.find(f'id="{table_id}"')
+    if at < 0:
+        return None
+    start = html.rfind("<table", 0, at)
+    end = html.find("</table>", at)
+    if start < 0 or end < 0:
+        return None
+    return html[start:end + len("</table>")]
+
+
+class DraftTableParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[dict] = []
+        self.round = 1
+        self._in_body = False
+        self._row: dict | None = None
+        self._row_text: list[str] = []
+        self._row_is_header = False
+        self._cell: str | None = None
+        self._text: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == "tbody":
+            self._in_body = True
+        elif tag == "tr" and self._in_body:
+            self._row, self._row_text = {}, []
+            self._row_is_header = "thead" in (a.get("class") or "")
+        elif tag in ("td", "th") and self._row is not None:
+            self._cell, self._text = a.get("data-stat") or "", []
+        elif tag == "a" and self._cell == "player":
+            m = PLAYER_HREF_RE.match(a.get("href") or "")
+            if m:
+                self._row["player_id"] = m.group(1)
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th") and self._cell is not None:
+            value = "".join(self._text).strip()
+            self._row_text.append(value)
+            if self._cell:
+                self._row[self._cell] = value or None
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            if self._row_is_header:
+                m = ROUND_RE.search(" ".join(self._row_text))
+                if m:
+                    self.round = int(m.group(1))
+            elif self._row.get("player") or self._row.get("pick_overall"):
+                self._row["draft_round"] = self.round
+                self.rows.append(self._row)
+            self._row = None
+        elif tag == "tbody":
+            self._in_body = False
+
+
+def parse_draft_page(html: str, year: int) -> pd.DataFrame:
+    """Tabla de draft de un año con columnas draft_* + las stats de carrera (por data-stat)."""
+    fragment = table_fragment(html)
+    if fragment is None:
+        raise ValueError(f"Draft {year}: no table id={DRAFT_TABLE_ID!r} in page")
+
+    parser = DraftTableParser()
+    parser.feed(fragment)
+    parser.close()
+
+    df = pd.DataFrame(parser.rows).drop(columns=["ranker"], errors="ignore").rename(columns=DATA_STAT_RENAME)
+    df["draft_year"] = year
+    for c in DRAFT_COLS:
+        if c not in df.columns:
+            df[c] = pd.NA
+
+    stats = [c for c in df.columns if c not in DRAFT_COLS]
+    for c in ["draft_round", "draft_pick"] + stats:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    return df[DRAFT_COLS + stats]
@@ -0,0 +1,273 @@
+"""
+Punto de entrada único del pipeline de datos.
+
+Declara las etapas (scripts de scripts/) como un DAG con sus entradas y salidas,
+calcula un hash del contenido de las entradas (incluido el propio script) y
+solo ejecuta las etapas cuyo hash ha cambiado o cuyas salidas faltan. Las ramas
+independientes (NBA / WNBA / NCAA) se ejecutan en paralelo, cada etapa en su
+propio proceso.
+
+Uso (desde la raíz del proyecto):
+    python scripts/build.py                 # lo que haya cambiado
+    python scripts/build.py master          # una etapa y sus dependencias
+    python scripts/build.py --force wnba_ready
+    python scripts/build.py --dry-run
+"""
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STATE_PATH = PROJECT_ROOT / "data_processed" / ".build_state.json"
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    script: str
+    inputs: tuple[str, ...]           # rutas o globs relativos a la raíz
+    outputs: tuple[str, ...]
+    deps: tuple[str, ...] = ()
+
+
+STAGES = [
+    # --- NBA (Kaggle sumitrodatta) ---
+    Stage(
+        "nba_normalize", "scripts/normalize_sumitrodatta.py",
+        inputs=(
+            "data_raw/kaggle/sumitrodatta/Player Per Game.csv",
+            "data_raw/kaggle/sumitrodatta/Draft Pick History.csv",
+        ),
+        outputs=(
+            "data_processed/nba_player_per_game_normalized.csv",
+            "data_processed/nba_draft_history_normalized.csv",
+        ),
+    ),
+    Stage(
+        "nba_master", "scripts/build_nba_master_datasetkaggle.py",
+        inputs=(
+            "data_processed/nba_player_per_game_normalized.csv",
+            "data_processed/nba_draft_history_normalized.csv",
+        ),
+        outputs=("data_processed/nba_master.csv",),
+        deps=("nba_normalize",),
+    ),
+    Stage(
+        "nba_ready", "scripts/postprocess_master_csv.py",
+        inputs=("data_processed/nba_master.csv", "scripts/season_codec.py"),
+        outputs=("data_processed/nba_master_ready.csv",),
+        deps=("nba_master",),
+    ),
+    # --- WNBA (un CSV por temporada) ---
+    Stage(
+        "wnba_merge", "scripts/merge_wnba.py",
+        inputs=("data_raw/wnba/[0-9][0-9][0-9][0-9].csv",),
+        outputs=("data_raw/wnba/wnba_combined.parquet",),
+    ),
+    Stage(
+        "wnba_normalize", "scripts/normalize_wnba_stats.py",
+        inputs=("data_raw/wnba/wnba_combined.parquet",),
+        outputs=("data_raw/wnba/wnba_normalized.csv",),
+        deps=("wnba_merge",),
+    ),
+    Stage(
+        "wnba_ready", "scripts/normalize_wnba_to_master_ready.py",
+        inputs=("data_raw/wnba/wnba_normalized.csv", "scripts/league_normalizer.py", "scripts/season_codec.py"),
+        outputs=("data_processed/wnba_master_ready.csv",),
+        deps=("wnba_normalize",),
+    ),
+    # --- NCAA ---
+    Stage(
+        "ncaa_ready", "scripts/normalize_ncaa_to_master_ready.py",
+        inputs=("data_raw/ncaa/ncaa-stats-complete.csv", "scripts/league_normalizer.py", "scripts/season_codec.py"),
+        outputs=("data_processed/ncaa_master_ready.csv",),
+    ),
+    Stage(
+        "ncaa_players", "scripts/normalize_ncaa_stats.py",
+        inputs=("data_raw/ncaa/ncaa-stats-complete.csv", "scripts/league_normalizer.py", "scripts/season_codec.py"),
+        outputs=("data_processed/ncaa_players_normalized.csv",),
+    ),
+    # --- Master de todas las ligas ---
+    Stage(
+        "master", "scripts/build_master_all_leagues.py",
+        inputs=(
+            "data_processed/nba_master_ready.csv",
+            "data_processed/wnba_master_ready.csv",
+            "data_processed/ncaa_master_ready.csv",
+            "app/schema.py",
+            "app/store.py",
+            "scripts/season_codec.py",
+        ),
+        outputs=(
+            "data_processed/master_all_leagues.csv",
+            "data_processed/master_all_leagues.parquet",
+            "data_processed/master_manifest.json",
+        ),
+        deps=("nba_ready", "wnba_ready", "ncaa_ready"),
+    ),
+]
+
+STAGES_BY_NAME = {s.name: s for s in STAGES}
+
+
+def expand(pattern: str) -> list[Path]:
+    """Ficheros que casan con una ruta/glob relativa a la raíz (ordenados)."""
+    if any(ch in pattern for ch in "*?["):
+        return sorted(p for p in PROJECT_ROOT.glob(pattern) if p.is_file())
+    path = PROJECT_ROOT / pattern
+    return [path] if path.exists() else []
+
+
+def stage_hash(stage: Stage) -> str:
+    """sha256 del script y del contenido de todas sus entradas (rutas incluidas)."""
+    h = hashlib.sha256()
+    for pattern in (stage.script,) + stage.inputs:
+        files = expand(pattern)
+        if not files:
+            h.update(f"{pattern}:<missing>".encode())
+        for path in files:
+            h.update(str(path.relative_to(PROJECT_ROOT)).encode())
+            with open(path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    h.update(chunk)
+    return h.hexdigest()
+
+
+def outputs_exist(stage: Stage) -> bool:
+    return all((PROJECT_ROOT / out).exists() for out in stage.outputs)
+
+
+def load_state() -> dict:
+    if STATE_PATH.exists():
+        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_state(state: dict) -> None:
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(STATE_PATH)
+
+
+def select_stages(targets: list[str]) -> list[Stage]:
+    """Las etapas pedidas más todas sus dependencias, en el orden declarado."""
+    if not targets:
+        return list(STAGES)
+
+    unknown = [t for t in targets if t not in STAGES_BY_NAME]
+    if unknown:
+        raise SystemExit(f"Etapas desconocidas: {unknown}. Disponibles: {list(STAGES_BY_NAME)}")
+
+    needed, pending = set(), list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(STAGES_BY_NAME[name].deps)
+    return [s for s in STAGES if s.name in needed]
+
+
+def run_stage(stage: Stage) -> tuple[int, str, float]:
+    """Ejecuta el script de la etapa en un proceso aparte (cwd = raíz del proyecto)."""
+    t0 = time.perf_counter()
+    p = subprocess.run(
+        [sys.executable, stage.script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return p.returncode, p.stdout + p.stderr, time.perf_counter() - t0
+
+
+def build(targets: list[str], force: bool = False, jobs: int = 4, dry_run: bool = False, verbose: bool = False) -> bool:
+    stages = select_stages(targets)
+    names = {s.name for s in stages}
+    state = load_state()
+
+    done: set[str] = set()      # ejecutadas o al día
+    planned: set[str] = set()   # (--dry-run) se ejecutarían
+    failed: set[str] = set()
+    running = {}
+
+    def ready(stage: Stage) -> bool:
+        return all(d in done or d not in names for d in stage.deps)
+
+    def blocked(stage: Stage) -> bool:
+        return any(d in failed for d in stage.deps)
+
+    pending = list(stages)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for stage in [s for s in pending if blocked(s)]:
+                pending.remove(stage)
+                failed.add(stage.name)
+                print(f"[skip] {stage.name}: falla una dependencia")
+
+            for stage in [s for s in pending if ready(s)]:
+                pending.remove(stage)
+                digest = stage_hash(stage)
+                stale = force or state.get(stage.name) != digest or not outputs_exist(stage)
+
+                if dry_run:
+                    # Sin ejecutar no sabemos si cambiarán las salidas de arriba: lo damos por hecho
+                    if stale or any(d in planned for d in stage.deps):
+                        planned.add(stage.name)
+                        print(f"[plan] {stage.name}: se ejecutaría ({stage.script})")
+                    else:
+                        print(f"[ok]   {stage.name}: sin cambios")
+                    done.add(stage.name)
+                elif not stale:
+                    print(f"[ok]   {stage.name}: sin cambios")
+                    done.add(stage.name)
+                else:
+                    print(f"[run]  {stage.name}: {stage.script}")
+                    running[pool.submit(run_stage, stage)] = (stage, digest)
+
+            if not running:
+                if pending and not any(ready(s) or blocked(s) for s in pending):
+                    raise RuntimeError(f"Dependencias no resolubles: {[s.name for s in pending]}")
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                stage, digest = running.pop(fut)
+                code, output, seconds = fut.result()
+                if code == 0:
+                    done.add(stage.name)
+                    # Hash de las entradas con las que se ejecutó la etapa
+                    state[stage.name] = digest
+                    save_state(state)
+                    print(f"[done] {stage.name} ({seconds:.1f}s)")
+                    if verbose:
+                        print(output.rstrip())
+                else:
+                    failed.add(stage.name)
+                    print(f"[FAIL] {stage.name} (exit {code}, {seconds:.1f}s)")
+                    print(output.rstrip())
+
+    print(f"\nResumen: {len(done)} ok, {len(failed)} con error/saltadas")
+    return not failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build incremental del pipeline de datos.")
+    parser.add_argument("targets", nargs="*", help=f"Etapas a construir (por defecto todas): {', '.join(STAGES_BY_NAME)}")
+    parser.add_argument("--force", action="store_true", help="Ejecuta aunque las entradas no hayan cambiado")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Etapas en paralelo (procesos)")
+    parser.add_argument("--dry-run", action="store_true", help="Solo muestra qué se ejecutaría")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Muestra la salida de cada etapa")
+    args = parser.parse_args()
+
+    ok = build(args.targets, force=args.force, jobs=args.jobs, dry_run=args.dry_run, verbose=args.verbose)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
+import sys
 import pandas as pd
 from pathlib import Path
 
+# Módulos compartidos con el dashboard (app/schema.py, app/store.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+from schema import CORE_COLS, add_career_columns, apply_schema, memory_report  # noqa: E402
+from store import MASTER_ARROW, MASTER_MANIFEST, MASTER_PARQUET, write_master_arrow, write_master_parquet  # noqa: E402
+from season_codec import YEAR, season_label, season_start_year  # noqa: E402
+
 NBA_PATH  = Path("data_processed/nba_master_ready.csv")   # AJUSTA si tu NBA está en otra ruta/nombre
 WNBA_PATH = Path("data_processed/wnba_master_ready.csv")
 NCAA_PATH = Path("data_processed/ncaa_master_ready.csv")
@@ -8,24 +15,6 @@ NCAA_PATH = Path("data_processed/ncaa_master_ready.csv")
 OUT_PATH  = Path("data_processed/master_all_leagues.csv")
 
 
-# Columnas "core" que queremos tener siempre (aunque sea con NA)
-CORE_COLS = [
-    "league", "lg",
-    "season", "season_start_year",
-    "player_name", "player_id",
-    "team", "pos", "age", "g",
-    "mp_per_game",
-    "pts_per_game", "ast_per_game", "trb_per_game",
-    "orb_per_game", "drb_per_game",
-    "stl_per_game", "blk_per_game", "tov_per_game", "pf_per_game",
-    "fg_per_game", "fga_per_game", "fg_percent",
-    "x3p_per_game", "x3pa_per_game", "x3p_percent",
-    "ft_per_game", "fta_per_game", "ft_percent",
-    "draft_year", "draft_round", "draft_pick", "draft_team", "college",
-    "rookie_season_start_year", "career_year",
-]
-
-
 def ensure_league_cols(df: pd.DataFrame, league_value: str) -> pd.DataFrame:
     df = df.copy()
 
@@ -88,24 +77,20 @@ def load_csv(path: Path, league_value: str) -> pd.DataFrame:
     # Derivar season_start_year si faltara (por seguridad)
     if df["season_start_year"].isna().all() and "season" in df.columns:
         # "2018-19" -> 2018  (si aplica)
-        tmp = df["season"].astype(str).str.slice(0, 4)
-        df["season_start_year"] = pd.to_numeric(tmp, errors="coerce")
+        df["season_start_year"] = season_start_year(df["season"])
 
     # Derivar season si faltara
     if df["season"].isna().all() and "season_start_year" in df.columns:
-        df["season"] = df["season_start_year"].apply(lambda y: f"{int(y)}" if pd.notna(y) else pd.NA)
+        df["season"] = season_label(df["season_start_year"], YEAR)
 
     df = coerce_numeric(df)
     df = reorder_columns(df)
     return df
 
 
-def main():
-    nba  = load_csv(NBA_PATH,  "NBA")
-    wnba = load_csv(WNBA_PATH, "WNBA")
-    ncaa = load_csv(NCAA_PATH, "NCAA")
-
-    master = pd.concat([nba, wnba, ncaa], ignore_index=True)
+def combine_leagues(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Une las ligas ya cargadas (load_csv) en el master: validaciones, tipos, rookie/career y orden."""
+    master = pd.concat(frames, ignore_index=True)
 
     # --- Validaciones clave ---
     # 1) Nunca vacíos
@@ -117,18 +102,45 @@ def main():
     # 2) Tipos útiles
     master = coerce_numeric(master)
 
+    # 2b) Rookie / año de carrera, igual para todas las ligas (el dashboard solo los lee)
+    master = add_career_columns(master)
+
     # 3) Orden final
-    master = reorder_columns(master)
+    return reorder_columns(master)
+
+
+def main():
+    nba  = load_csv(NBA_PATH,  "NBA")
+    wnba = load_csv(WNBA_PATH, "WNBA")
+    ncaa = load_csv(NCAA_PATH, "NCAA")
+
+    master = combine_leagues([nba, wnba, ncaa])
 
     OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     master.to_csv(OUT_PATH, index=False)
 
+    # 4) Esquema compacto (category / Int16 / float32) para las copias columnares
+    typed = apply_schema(master)
+
+    # Copia columnar tipada que lee load_master (el CSV queda como export legible)
+    write_master_parquet(typed, MASTER_PARQUET)
+    # Copia mapeable en memoria que comparten todos los procesos del dashboard
+    arrow_path = write_master_arrow(typed, MASTER_ARROW)
+
     print(f"Saved: {OUT_PATH.resolve()}")
+    print(f"Saved: {MASTER_PARQUET.resolve()} (Parquet, particionado por league)")
+    print(f"Saved: {arrow_path.resolve()} (Arrow IPC, mapeable; publicado en {MASTER_MANIFEST})")
     print(f"Rows: {len(master)} | Cols: {len(master.columns)}")
     print("League counts:")
     print(master["league"].value_counts(dropna=False))
     print("Missing league:", master["league"].isna().sum(), "| Missing lg:", master["lg"].isna().sum())
 
+    report = memory_report(master, typed)
+    mb_before, mb_after = report["mb_before"].sum(), report["mb_after"].sum()
+    print(f"Memoria en pandas: {mb_before:.1f} MB -> {mb_after:.1f} MB "
+          f"(-{(1 - mb_after / mb_before) * 100:.0f}%)")
+    print(report.head(10).round(2).to_string())
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,16 @@
 import time
 import random
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
-import requests
+
+from bbref_draft_parser import parse_draft_page
+from http_cache import DAY, HttpCache
+
+# Drafts de años anteriores ya no cambian: se descargan una vez y se quedan en caché
+CURRENT_YEAR = pd.Timestamp.today().year
+PARSE_WORKERS = 2
 
 def project_paths():
     project_root = Path(__file__).resolve().parent.parent
@@ -12,39 +19,44 @@ def project_paths():
     out_path = raw_dir / "bbref_draft_all.csv"
     return out_path
 
-def fetch_draft_year(year: int) -> pd.DataFrame:
+def fetch_draft_year(year: int, cache: HttpCache) -> tuple[str, bool]:
     url = f"https://www.basketball-reference.com/draft/NBA_{year}.html"
     headers = {
         "User-Agent": "Mozilla/5.0",
     }
-    r = requests.get(url, headers=headers, timeout=60)
-    r.raise_for_status()
-
-    # Basketball-Reference tables can be parsed via read_html
-    tables = pd.read_html(r.text)
-    # The main draft table is usually the first one
-    df = tables[0].copy()
-    df["draft_year"] = year
-    return df
+    r = cache.get(url, headers=headers, ttl=DAY, immutable=year < CURRENT_YEAR, timeout=60)
+    return r.text, r.from_cache
 
 def main():
     out_path = project_paths()
+    cache = HttpCache(out_path.parent.parent / ".http_cache" / "bbref")
 
     # NBA draft years on BBRef start 1947
-    years = list(range(1947, 2025))
-
-    all_dfs = []
-    for i, y in enumerate(years, start=1):
-        print(f"[{i}/{len(years)}] Draft {y}")
-        try:
-            df = fetch_draft_year(y)
-            all_dfs.append(df)
-        except Exception as e:
-            print(f"  ERROR year={y}: {e}")
-            continue
-
-        # polite delay
-        time.sleep(1.5 + random.uniform(0, 1.0))
+    years = list(range(1947, CURRENT_YEAR + 1))
+
+    # Fetch in this loop, parse in worker processes: parsing year N overlaps
+    # with downloading year N+1
+    futures = {}
+    with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as pool:
+        for i, y in enumerate(years, start=1):
+            print(f"[{i}/{len(years)}] Draft {y}")
+            try:
+                html, from_cache = fetch_draft_year(y, cache)
+            except Exception as e:
+                print(f"  ERROR year={y}: {e}")
+                continue
+            futures[y] = pool.submit(parse_draft_page, html, y)
+
+            # polite delay (only when we actually hit the server)
+            if not from_cache:
+                time.sleep(1.5 + random.uniform(0, 1.0))
+
+        all_dfs = []
+        for y, fut in futures.items():
+            try:
+                all_dfs.append(fut.result())
+            except Exception as e:
+                print(f"  PARSE ERROR year={y}: {e}")
 
     master = pd.concat(all_dfs, ignore_index=True)
     master.to_csv(out_path, index=False)
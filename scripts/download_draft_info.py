@@ -1,47 +1,153 @@
+"""
+Draft / carrera de todos los jugadores NBA conocidos por nba_api (CommonPlayerInfo).
+
+- Cada respuesta pasa por la caché HTTP (retirados = inmutables).
+- Los registros se van guardando por lotes en un checkpoint SQLite: si el
+  proceso se corta, al relanzarlo se saltan los retirados ya descargados (los
+  activos se revalidan contra la caché según ACTIVE_TTL).
+- Peticiones en paralelo bajo un límite global de peticiones/segundo.
+- Al final se exporta el checkpoint completo a nba_draft_info.csv.
+"""
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+
 import pandas as pd
 from nba_api.stats.static import players
-from nba_api.stats.endpoints import commonplayerinfo
-import time
+from nba_api.stats.library.http import STATS_HEADERS
+
+from fetch_engine import TokenBucket
+from http_cache import DAY, HttpCache
+
+# Mismo endpoint que commonplayerinfo.CommonPlayerInfo, pedido a través de la caché
+COMMON_PLAYER_INFO_URL = "https://stats.nba.com/stats/commonplayerinfo"
+
+# Jugadores en activo: su ficha puede cambiar (equipo, to_year) -> revalidar cada semana.
+# Retirados: el draft y su carrera ya no cambian -> inmutables, no se vuelven a pedir.
+ACTIVE_TTL = 7 * DAY
+
+# Límite global (todos los hilos juntos) de ~1 petición/s: el ritmo que tenía el
+# bucle secuencial original (latencia de la petición + sleep(0.6)), no más carga
+RATE_PER_SEC = 1.0
+MAX_WORKERS = 4
+MAX_RETRIES = 3
+BATCH_SIZE = 50            # registros por commit del checkpoint
+
+RECORD_COLS = [
+    "player_id", "full_name", "first_name", "last_name",
+    "draft_year", "draft_round", "draft_number",
+    "from_year", "to_year", "team_id",
+]
+
+
+def open_checkpoint(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(path)
+    cols = ", ".join(f"{c} TEXT" for c in RECORD_COLS[1:])
+    con.execute(f"CREATE TABLE IF NOT EXISTS draft_info (player_id INTEGER PRIMARY KEY, {cols}, fetched_at REAL)")
+    return con
+
+
+def done_ids(con: sqlite3.Connection) -> set[int]:
+    return {pid for (pid,) in con.execute("SELECT player_id FROM draft_info")}
 
-def download_draft_info():
+
+def save_batch(con: sqlite3.Connection, records: list[dict]) -> None:
+    placeholders = ", ".join("?" for _ in range(len(RECORD_COLS) + 1))
+    con.executemany(
+        f"INSERT OR REPLACE INTO draft_info ({', '.join(RECORD_COLS)}, fetched_at) VALUES ({placeholders})",
+        [[r[c] for c in RECORD_COLS] + [time.time()] for r in records],
+    )
+    con.commit()
+
+
+def fetch_player_info(cache: HttpCache, bucket: TokenBucket, pid: int, is_active: bool) -> dict:
+    url = COMMON_PLAYER_INFO_URL
+    params = {"PlayerID": pid, "LeagueID": ""}
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        # Las respuestas que ya están en caché no gastan turno del límite
+        if not cache.is_fresh(url, params):
+            bucket.acquire()
+        try:
+            r = cache.get(url, params=params, headers=STATS_HEADERS, ttl=ACTIVE_TTL, immutable=not is_active, timeout=30)
+            break
+        except Exception:
+            if attempt == MAX_RETRIES:
+                raise
+            bucket.cool_down(2 * attempt)
+
+    result = r.json()["resultSets"][0]
+    return dict(zip(result["headers"], result["rowSet"][0])) if result["rowSet"] else {}
+
+
+def to_record(p: dict, info: dict) -> dict:
+    return {
+        "player_id": p["id"],
+        "full_name": p["full_name"],
+        "first_name": p["first_name"],
+        "last_name": p["last_name"],
+        "draft_year": info.get("DRAFT_YEAR", None),
+        "draft_round": info.get("DRAFT_ROUND", None),
+        "draft_number": info.get("DRAFT_NUMBER", None),
+        "from_year": info.get("FROM_YEAR", None),
+        "to_year": info.get("TO_YEAR", None),
+        "team_id": info.get("TEAM_ID", None),
+    }
+
+
+def download_draft_info(cache_dir: Path, checkpoint: Path) -> pd.DataFrame:
     # Get list of all NBA players known by nba_api
     player_list = players.get_players()
-    records = []
+    cache = HttpCache(cache_dir)
+    bucket = TokenBucket(RATE_PER_SEC)
+    con = open_checkpoint(checkpoint)
 
-    for p in player_list:
-        pid = p["id"]
+    # Del checkpoint solo se saltan los retirados (inmutables). Los activos vuelven a la
+    # cola: pasan por la caché HTTP, que solo los pide de nuevo si caducó su ACTIVE_TTL
+    done = done_ids(con)
+    skip = {p["id"] for p in player_list if p["id"] in done and not p["is_active"]}
+    pending = [p for p in player_list if p["id"] not in skip]
+    print(
+        f"Players: {len(player_list)} | retired in checkpoint: {len(skip)} | "
+        f"active to revalidate: {len(done) - len(skip)} | pending: {len(pending)}"
+    )
 
-        try:
-            info = commonplayerinfo.CommonPlayerInfo(player_id=pid).get_data_frames()[0]
-            record = {
-                "player_id": pid,
-                "full_name": p["full_name"],
-                "first_name": p["first_name"],
-                "last_name": p["last_name"],
-                "draft_year": info.get("DRAFT_YEAR", None),
-                "draft_round": info.get("DRAFT_ROUND", None),
-                "draft_number": info.get("DRAFT_NUMBER", None),
-                "from_year": info.get("FROM_YEAR", None),
-                "to_year": info.get("TO_YEAR", None),
-                "team_id": info.get("TEAM_ID", None),
-            }
-            records.append(record)
-
-        except Exception as e:
-            print(f"Error with player_id={pid}: {e}")
-            time.sleep(2)
-            continue
-
-        time.sleep(0.6)
-
-    df = pd.DataFrame(records)
+    t0 = time.perf_counter()
+    batch, ok, errors = [], 0, 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(fetch_player_info, cache, bucket, p["id"], p["is_active"]): p for p in pending}
+        for i, fut in enumerate(as_completed(futures), start=1):
+            p = futures[fut]
+            try:
+                batch.append(to_record(p, fut.result()))
+                ok += 1
+            except Exception as e:
+                errors += 1
+                print(f"Error with player_id={p['id']}: {e}")
+
+            if len(batch) >= BATCH_SIZE or i == len(pending):
+                save_batch(con, batch)
+                batch = []
+                elapsed = max(time.perf_counter() - t0, 1e-9)
+                rate = i / elapsed * 60
+                eta = (len(pending) - i) / (i / elapsed) / 60
+                print(f"  {i}/{len(pending)} | {rate:.0f} players/min | ETA {eta:.1f} min | errors {errors}")
+
+    print(f"Downloaded: {ok} | errors: {errors} (re-run to retry them)")
+    df = pd.read_sql_query(f"SELECT {', '.join(RECORD_COLS)} FROM draft_info ORDER BY player_id", con)
+    con.close()
     return df
 
 
 if __name__ == "__main__":
-    df_draft = download_draft_info()
+    project_root = Path(__file__).resolve().parent.parent
+    out_path = project_root / "data_raw" / "nba" / "nba_draft_info.csv"
 
-    out_path = "../data_raw/nba/nba_draft_info.csv"
+    df_draft = download_draft_info(
+        cache_dir=project_root / "data_raw" / ".http_cache" / "nba_stats",
+        checkpoint=out_path.with_suffix(".sqlite"),
+    )
     df_draft.to_csv(out_path, index=False)
-    print("Saved draft info to", out_path)
\ No newline at end of file
+    print("Saved draft info to", out_path)
@@ -1,9 +1,22 @@
-import time
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 from nba_api.stats.endpoints import leaguedashplayerstats
 
+from fetch_engine import FetchEngine, FetchJob
+
+# Ritmo máximo "seguro" con stats.nba.com: ~1 petición cada 1.5s entre todos los hilos
+RATE_PER_SEC = 1 / 1.5
+MAX_WORKERS = 3
+
+
+def current_season() -> str:
+    """Temporada NBA en curso ("YYYY-YY"): empieza en octubre."""
+    today = pd.Timestamp.today()
+    start = today.year if today.month >= 10 else today.year - 1
+    return f"{start}-{str(start + 1)[-2:]}"
+
 
 def get_nba_season_stats(
     season: str,
@@ -76,27 +89,14 @@ def main():
     print(f"Output directory: {out_dir}")
 
     # --------------------------
-    # 3) Loop over seasons / types / per_modes
+    # 3) One job per season / type / per_mode (shared rate limit + retries)
+    #    Seasons already on disk are skipped, except the one in progress
     # --------------------------
+    open_season = current_season()
+    jobs = []
     for season in seasons:
         for season_type in season_types:
             for per_mode in per_modes:
-                print(
-                    f"\n=== Downloading NBA stats for {season} "
-                    f"({season_type}, {per_mode}) ==="
-                )
-
-                try:
-                    df = get_nba_season_stats(
-                        season=season,
-                        season_type=season_type,
-                        per_mode=per_mode,
-                    )
-                except Exception as e:
-                    print(f"Error downloading {season} {season_type} {per_mode}: {e}")
-                    time.sleep(3)
-                    continue
-
                 # Build output path, e.g.:
                 # nba_players_201819_regularseason_pergame.csv
                 season_flat = season.replace("-", "")
@@ -107,13 +107,19 @@ def main():
                     f"nba_players_{season_flat}_"
                     f"{season_type_token}_{per_mode_token}.csv"
                 )
-                out_path = out_dir / filename
-
-                df.to_csv(out_path, index=False)
-                print(f"Saved {len(df)} rows to {out_path}")
-
-                # Be nice to the API
-                time.sleep(1.5)
+                jobs.append(FetchJob(
+                    key=f"NBA {season} {season_type} {per_mode}",
+                    fetch=partial(get_nba_season_stats, season, season_type, per_mode),
+                    out_path=out_dir / filename,
+                    refresh=season == open_season,
+                ))
+
+    engine = FetchEngine(
+        rate=RATE_PER_SEC,
+        max_workers=MAX_WORKERS,
+        state_path=out_dir / "_download_state.json",
+    )
+    engine.run(jobs)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
-import time
-import random
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 from nba_api.stats.endpoints import leaguedashplayerstats
 from nba_api.stats.library.parameters import SeasonTypeAllStar, PerModeDetailed
 
+from fetch_engine import FetchEngine, FetchJob
+
 
 # ---- Config ----
 OUT_DIR = Path("data_raw/wnba")
@@ -18,7 +19,8 @@ PER_MODE = PerModeDetailed.perGame             # "PerGame"
 LEAGUE_ID_WNBA = "10"
 
 # You can tune these if you keep getting throttled/timeouts
-SLEEP_BETWEEN_CALLS_SEC = (1.2, 2.3)  # random sleep range between requests
+RATE_PER_SEC = 1 / 1.75  # global limit shared by all workers (~ old 1.2-2.3s sleep)
+MAX_WORKERS = 3
 MAX_RETRIES = 6
 TIMEOUT_SEC = 60  # nba_api uses requests under the hood; timeout is handled internally in most cases
 
@@ -56,62 +58,35 @@ def fetch_wnba_player_stats(season_year: int) -> pd.DataFrame:
     return df
 
 
-def fetch_with_retries(season_year: int) -> pd.DataFrame | None:
-    """
-    Retry with exponential backoff + jitter.
-    Returns None if it ultimately fails.
-    """
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            df = fetch_wnba_player_stats(season_year)
-            return df
-        except Exception as e:
-            wait = min(60, (2 ** (attempt - 1))) + random.uniform(0.0, 1.0)
-            print(f"[{season_year}] ERROR attempt {attempt}/{MAX_RETRIES}: {e}")
-            if attempt < MAX_RETRIES:
-                print(f"[{season_year}] retrying in {wait:.1f}s ...")
-                time.sleep(wait)
-            else:
-                print(f"[{season_year}] giving up.")
-                return None
-
-
 def main():
     # WNBA started 1997
     start_year = 1997
     end_year = pd.Timestamp.today().year  # current year
 
-    all_dfs = []
-    ok, fail, skipped = 0, 0, 0
-
     print(f"Downloading WNBA seasons {start_year}..{end_year} (Regular Season, PerGame)")
 
-    for i, year in enumerate(range(start_year, end_year + 1), start=1):
-        out_csv = OUT_DIR / f"wnba_players_{year}.csv"
-
-        # Skip if already downloaded
-        if out_csv.exists() and out_csv.stat().st_size > 0:
-            print(f"[{i}/{end_year - start_year + 1}] {year} -> already exists, skip")
-            skipped += 1
-            continue
-
-        print(f"[{i}/{end_year - start_year + 1}] {year} -> downloading...")
-
-        df = fetch_with_retries(year)
-        if df is None or df.empty:
-            fail += 1
-            continue
-
-        df.to_csv(out_csv, index=False)
-        print(f"[{year}] saved -> {out_csv} (rows={len(df)})")
-
-        all_dfs.append(df)
-        ok += 1
-
-        # polite sleep (avoid throttling)
-        time.sleep(random.uniform(*SLEEP_BETWEEN_CALLS_SEC))
+    # One job per season; the engine skips the ones already on disk (except the
+    # current season, whose stats still change) and handles rate limiting +
+    # retries with backoff for each request
+    jobs = [
+        FetchJob(
+            key=f"WNBA {year}",
+            fetch=partial(fetch_wnba_player_stats, year),
+            out_path=OUT_DIR / f"wnba_players_{year}.csv",
+            refresh=year == end_year,
+        )
+        for year in range(start_year, end_year + 1)
+    ]
+    engine = FetchEngine(
+        rate=RATE_PER_SEC,
+        max_workers=MAX_WORKERS,
+        max_retries=MAX_RETRIES,
+        state_path=OUT_DIR / "_download_state.json",
+    )
+    results = engine.run(jobs)
 
     # Build a combined file from whatever we managed to download this run
+    all_dfs = [results[job.key] for job in jobs if job.key in results and not results[job.key].empty]
     if all_dfs:
         master = pd.concat(all_dfs, ignore_index=True)
         master_csv = OUT_DIR / "wnba_players_all_seasons_raw.csv"
@@ -120,8 +95,6 @@ def main():
     else:
         print("\n⚠️ No seasons downloaded in this run (maybe all were skipped or all failed).")
 
-    print(f"\nSummary: ok={ok} skipped={skipped} failed={fail}")
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,171 @@
+"""
+Motor de descargas compartido para los scripts de stats.nba.com (NBA y WNBA).
+
+- TokenBucket: límite de peticiones/segundo global, común a todos los hilos.
+- FetchEngine: ejecuta los trabajos con concurrencia acotada, reintentos con
+  backoff exponencial + jitter por petición (un fallo no bloquea al resto) y
+  un fichero de estado JSON para reanudar una descarga interrumpida. Un trabajo
+  con CSV en disco no se repite, salvo que sea refresh (temporada en curso).
+
+La función de descarga de cada trabajo es inyectable, así que se puede probar
+con un stub local en vez de stats.nba.com.
+"""
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+
+class TokenBucket:
+    """Permite `rate` peticiones por segundo de media, con ráfagas de hasta `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Bloquea el hilo que llama hasta que haya un token disponible."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def cool_down(self, seconds: float) -> None:
+        """Frena a todos los hilos (p.ej. tras un throttling/timeout del servidor)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@dataclass(frozen=True)
+class FetchJob:
+    key: str                               # identificador estable (para el estado)
+    fetch: Callable[[], pd.DataFrame]      # descarga; puede lanzar excepción
+    out_path: Path                         # CSV de salida
+    refresh: bool = False                  # pedir siempre (p.ej. temporada en curso), aunque exista el CSV
+
+
+class FetchEngine:
+    def __init__(
+        self,
+        rate: float = 1 / 1.5,
+        burst: int = 1,
+        max_workers: int = 3,
+        max_retries: int = 6,
+        backoff_max: float = 60.0,
+        state_path: Path | None = None,
+    ):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_max = backoff_max
+        self.state_path = state_path
+        self._state = self._load_state()
+        self._lock = threading.Lock()
+
+    # --- Estado reanudable ---
+    def _load_state(self) -> dict:
+        if self.state_path and self.state_path.exists():
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        return {"done": {}, "failed": {}}
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._state, indent=2), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    def is_done(self, job: FetchJob) -> bool:
+        # Hecho = CSV ya en disco (también los bajados antes de existir el estado),
+        # salvo los trabajos marcados refresh, cuyos datos aún cambian
+        if job.refresh:
+            return False
+        return job.out_path.exists() and job.out_path.stat().st_size > 0
+
+    def _mark(self, job: FetchJob, ok: bool, info: dict) -> None:
+        with self._lock:
+            self._state["done" if ok else "failed"][job.key] = info
+            if ok:
+                self._state["failed"].pop(job.key, None)
+            self._save_state()
+
+    # --- Descarga ---
+    def _run_one(self, job: FetchJob) -> pd.DataFrame | None:
+        for attempt in range(1, self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                df = job.fetch()
+            except Exception as e:
+                wait = min(self.backoff_max, 2 ** (attempt - 1)) + random.uniform(0.0, 1.0)
+                print(f"[{job.key}] ERROR attempt {attempt}/{self.max_retries}: {e}")
+                if attempt == self.max_retries:
+                    self._mark(job, False, {"error": str(e), "attempts": attempt})
+                    print(f"[{job.key}] giving up.")
+                    return None
+                # Probable throttling: frenamos también al resto de hilos un poco
+                self.bucket.cool_down(wait / 2)
+                time.sleep(wait)
+                continue
+
+            if df is None or df.empty:
+                # Sin filas (p.ej. una temporada que aún no ha empezado): no se guarda
+                # nada, así que is_done() sigue en falso y se reintenta en la próxima ejecución
+                self._mark(job, False, {"error": "empty response", "attempts": attempt})
+                print(f"[{job.key}] empty response, not saved.")
+                return None
+
+            # Vía fichero temporal + rename: un proceso cortado a mitad de escritura no
+            # deja un CSV truncado que is_done() daría por bueno en las siguientes ejecuciones
+            job.out_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = job.out_path.with_name(job.out_path.name + ".tmp")
+            df.to_csv(tmp, index=False)
+            os.replace(tmp, job.out_path)
+            self._mark(job, True, {
+                "rows": len(df),
+                "path": str(job.out_path),
+                "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            })
+            print(f"[{job.key}] saved {len(df)} rows -> {job.out_path}")
+            return df
+        return None
+
+    def run(self, jobs: list[FetchJob]) -> dict:
+        """Descarga los trabajos pendientes. Devuelve {key: DataFrame} de lo bajado en esta ejecución."""
+        pending = [j for j in jobs if not self.is_done(j)]
+        skipped = len(jobs) - len(pending)
+        refresh = sum(j.refresh for j in pending)
+        print(f"Jobs: {len(jobs)} | pending: {len(pending)} (refresh: {refresh}) | already done: {skipped}")
+
+        t0 = time.perf_counter()
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._run_one, job): job for job in pending}
+            for i, fut in enumerate(as_completed(futures), start=1):
+                df = fut.result()
+                if df is not None:
+                    results[futures[fut].key] = df
+                elapsed = max(time.perf_counter() - t0, 1e-9)
+                print(f"  progress {i}/{len(pending)} ({i / elapsed * 60:.1f} req/min)")
+
+        failed = len(pending) - len(results)
+        print(f"\nSummary: ok={len(results)} skipped={skipped} failed={failed}")
+        return results
@@ -0,0 +1,77 @@
+"""
+Healthcheck del dashboard: OK solo cuando el servidor responde Y el precalentado
+de cachés (app/warmup.py, lanzado por app/serve.py) ha terminado en ESA
+instancia: el marcador es el del puerto de --url y el proceso que lo escribió
+tiene que seguir vivo.
+
+Sale con 0 si está listo y 1 si no (para HEALTHCHECK de Docker, balanceadores...).
+
+Uso (desde la raíz del proyecto):
+    python scripts/healthcheck.py
+    python scripts/healthcheck.py --url http://localhost:8502
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+
+# Lo escribe app/warmup.py, uno por puerto (se lee a mano para no importar streamlit en cada check)
+MARKER_DIR = Path("data_processed")
+DEFAULT_URL = "http://localhost:8501"
+TIMEOUT = 5
+
+
+def marker_path(url: str) -> Path:
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return MARKER_DIR / f".warmup.{port}.json"
+
+
+def process_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # En Windows os.kill(pid, 0) terminaría el proceso: ahí basta con la respuesta del servidor
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def check(url: str) -> tuple[bool, str]:
+    marker = marker_path(url)
+    if not marker.exists():
+        return False, f"sin marcador de precalentado {marker} (¿arrancado con app/serve.py en ese puerto?)"
+    status = json.loads(marker.read_text(encoding="utf-8"))
+    if not process_alive(status["pid"]):
+        return False, f"marcador de un proceso que ya no existe (pid {status['pid']})"
+    if status["status"] != "ready":
+        return False, f"precalentado: {status['status']}" + (f" ({status['error']})" if "error" in status else "")
+
+    try:
+        r = requests.get(f"{url.rstrip('/')}/_stcore/health", timeout=TIMEOUT)
+    except requests.RequestException as e:
+        return False, f"servidor no responde: {e}"
+    if r.status_code != 200:
+        return False, f"servidor: HTTP {r.status_code}"
+    return True, f"listo (versión {status['version']}, precalentado {sum(status['seconds'].values()):.1f}s)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Healthcheck del dashboard (servidor + precalentado).")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"URL base del servidor (por defecto {DEFAULT_URL})")
+    args = parser.parse_args()
+
+    ok, message = check(args.url)
+    print(message)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Caché en disco de respuestas HTTP para los scrapers (Basketball-Reference, stats.nba.com).
+
+Cada respuesta se guarda por clave = sha1(URL + parámetros):
+    <root>/<clave>.body   cuerpo tal cual
+    <root>/<clave>.json   metadatos (url, params, ETag, Last-Modified, fecha, ttl, immutable)
+
+Al pedir una URL:
+- immutable (temporadas/drafts históricos): si está en disco, nunca se vuelve a pedir.
+- dentro del TTL: se sirve del disco sin red.
+- TTL vencido: petición condicional (If-None-Match / If-Modified-Since); un 304
+  renueva la fecha y se sirve el cuerpo guardado.
+"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from pathlib import Path
+
+import requests
+
+DEFAULT_CACHE_DIR = Path("data_raw/.http_cache")
+DAY = 24 * 3600
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status: int
+    text: str
+    from_cache: bool     # True si no hubo que descargar el cuerpo (disco o 304)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def cache_key(url: str, params: dict | None = None) -> str:
+    payload = json.dumps([url, sorted((params or {}).items())], default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, ttl: float = DAY, session: requests.Session | None = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.session = session or requests.Session()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def _load(self, key: str) -> tuple[dict, str] | None:
+        meta_path, body_path = self._paths(key)
+        if not (meta_path.exists() and body_path.exists()):
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return meta, body_path.read_text(encoding="utf-8")
+
+    def _save(self, key: str, meta: dict, body: str | None = None) -> None:
+        meta_path, body_path = self._paths(key)
+        # Primero el cuerpo y luego los metadatos: una entrada a medias no se da por válida
+        for path, text in ((body_path, body), (meta_path, json.dumps(meta, indent=2))):
+            if text is None:
+                continue
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+
+    def is_fresh(self, url: str, params: dict | None = None) -> bool:
+        """True si get() respondería desde disco sin tocar la red."""
+        cached = self._load(cache_key(url, params))
+        if cached is None:
+            return False
+        meta = cached[0]
+        return meta.get("immutable", False) or time.time() - meta["fetched_at"] < meta.get("ttl", self.ttl)
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        ttl: float | None = None,
+        immutable: bool = False,
+        timeout: float = 60,
+    ) -> CachedResponse:
+        key = cache_key(url, params)
+        ttl = self.ttl if ttl is None else ttl
+        cached = self._load(key)
+
+        if cached is not None:
+            meta, body = cached
+            age = time.time() - meta["fetched_at"]
+            if meta.get("immutable") or age < meta.get("ttl", ttl):
+                return CachedResponse(url, meta["status"], body, from_cache=True)
+
+        # Petición (condicional si ya teníamos una versión)
+        req_headers = dict(headers or {})
+        if cached is not None:
+            meta = cached[0]
+            if meta.get("etag"):
+                req_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                req_headers["If-Modified-Since"] = meta["last_modified"]
+            elif not meta.get("etag"):
+                req_headers["If-Modified-Since"] = formatdate(meta["fetched_at"], usegmt=True)
+
+        r = self.session.get(url, params=params, headers=req_headers, timeout=timeout)
+
+        if r.status_code == 304 and cached is not None:
+            meta, body = cached
+            meta.update(fetched_at=time.time(), ttl=ttl, immutable=immutable or meta.get("immutable", False))
+            self._save(key, meta)
+            return CachedResponse(url, meta["status"], body, from_cache=True)
+
+        r.raise_for_status()
+        meta = {
+            "url": url,
+            "params": params or {},
+            "status": r.status_code,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "ttl": ttl,
+            "immutable": immutable,
+        }
+        self._save(key, meta, r.text)
+        return CachedResponse(url, r.status_code, r.text, from_cache=False)
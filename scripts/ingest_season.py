@@ -0,0 +1,196 @@
+"""
+Ingesta incremental de UNA temporada en el master particionado.
+
+Normaliza solo el fichero de esa liga/temporada, reemplaza sus filas en la
+partición Parquet de la liga, actualiza rookie/career_year únicamente de los
+jugadores afectados y refresca el manifest y la copia Arrow que lee el dashboard.
+
+Uso (desde la raíz del proyecto):
+    python scripts/ingest_season.py WNBA 2025
+    python scripts/ingest_season.py NBA 2024 --file data_raw/nba/nba_players_202425_regularseason_pergame.csv
+    python scripts/ingest_season.py NCAA 2024
+
+Nota: el CSV master_all_leagues.csv no se reescribe aquí (solo en el build
+completo); el dashboard solo lee la copia Arrow publicada (versionada), así
+que reescribir aquí la partición Parquet no afecta a las sesiones abiertas.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+# Módulos compartidos con el dashboard (app/schema.py, app/store.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+from build_master_all_leagues import (  # noqa: E402
+    CORE_COLS, coerce_numeric, ensure_columns, ensure_league_cols, reorder_columns,
+)
+import merge_wnba  # noqa: E402
+from league_normalizer import NCAA, WNBA, normalize, read_league  # noqa: E402
+from schema import player_keys  # noqa: E402
+from season_codec import season_label  # noqa: E402
+from store import (  # noqa: E402
+    MASTER_ARROW,
+    conform, master_schema, partition_path, read_manifest,
+    read_master_parquet, write_manifest, write_master_arrow, write_partition,
+)
+
+# nba_api (LeagueDashPlayerStats, PerGame) -> esquema master
+NBA_API_RENAME = {
+    "PLAYER_NAME": "player_name",
+    "TEAM_ABBREVIATION": "team",
+    "AGE": "age",
+    "GP": "g",
+    "MIN": "mp_per_game",
+    "PTS": "pts_per_game",
+    "AST": "ast_per_game",
+    "REB": "trb_per_game",
+    "OREB": "orb_per_game",
+    "DREB": "drb_per_game",
+    "STL": "stl_per_game",
+    "BLK": "blk_per_game",
+    "TOV": "tov_per_game",
+    "PF": "pf_per_game",
+    "FGM": "fg_per_game",
+    "FGA": "fga_per_game",
+    "FG_PCT": "fg_percent",
+    "FG3M": "x3p_per_game",
+    "FG3A": "x3pa_per_game",
+    "FG3_PCT": "x3p_percent",
+    "FTM": "ft_per_game",
+    "FTA": "fta_per_game",
+    "FT_PCT": "ft_percent",
+}
+DRAFT_COLS = ["player_id", "draft_year", "draft_round", "draft_pick", "draft_team", "college"]
+
+
+def default_file(league: str, year: int) -> Path:
+    if league == "WNBA":
+        return Path(f"data_raw/wnba/{year}.csv")
+    if league == "NCAA":
+        return Path("data_raw/ncaa/ncaa-stats-complete.csv")
+    season_flat = f"{year}{str(year + 1)[-2:]}"
+    return Path(f"data_raw/nba/nba_players_{season_flat}_regularseason_pergame.csv")
+
+
+def load_wnba(path: Path, year: int) -> pd.DataFrame:
+    # Mismo formato (y validación de cabecera) que los CSV por año que une merge_wnba.py
+    df = merge_wnba.read_season(path, year)
+    return normalize(WNBA, df)
+
+
+def load_ncaa(path: Path, year: int) -> pd.DataFrame:
+    df = read_league(NCAA, path)
+    return normalize(NCAA, df[df["year"] == year])
+
+
+def load_nba(path: Path, year: int) -> pd.DataFrame:
+    df = pd.read_csv(path).rename(columns=NBA_API_RENAME)
+    df["league"] = "NBA"
+    df["lg"] = "NBA"
+    df["season_start_year"] = year
+    df["season"] = df["Season"] if "Season" in df.columns else season_label(df["season_start_year"])
+
+    # nba_api usa ids numéricos; reutilizamos el player_id (y el draft) del master por nombre
+    known = read_master_parquet(leagues=["NBA"], columns=["player_name"] + DRAFT_COLS)
+    known = known.dropna(subset=["player_id"]).drop_duplicates("player_name")
+    known["player_name"] = known["player_name"].astype("string")
+    df["player_name"] = df["player_name"].astype("string")
+    df = df.merge(known, on="player_name", how="left")
+    df["player_id"] = df["player_id"].astype("string").fillna("nba_api:" + df["PLAYER_ID"].astype("string"))
+    return df
+
+
+LOADERS = {"WNBA": load_wnba, "NCAA": load_ncaa, "NBA": load_nba}
+
+
+def prepare(df: pd.DataFrame, league: str) -> pd.DataFrame:
+    """Los mismos pasos que build_master_all_leagues.load_csv, sobre la temporada nueva."""
+    df = ensure_league_cols(df, league)
+    df = ensure_columns(df, CORE_COLS)
+    df = coerce_numeric(df)
+    return reorder_columns(df)
+
+
+def update_careers(old: pd.DataFrame, new: pd.DataFrame, year: int) -> tuple[pd.DataFrame, int]:
+    """
+    Partición de la liga con la temporada `year` reemplazada por `new`.
+
+    Recalcula rookie/career_year solo para los jugadores de la temporada ingerida
+    (y los que estaban en la versión anterior de esa temporada); devuelve la
+    partición nueva y cuántas filas de otras temporadas han cambiado de rookie
+    (p.ej. al hacer backfill de una temporada antigua).
+    """
+    years = pd.to_numeric(old["season_start_year"], errors="coerce")
+    replaced, rest = old[years == year], old[years != year]
+    affected = set(player_keys(new).dropna()) | set(player_keys(replaced).dropna())
+
+    df = pd.concat([rest, new], ignore_index=True)
+    keys = player_keys(df)
+    hit = keys.isin(affected)
+
+    # Rookie de cada afectado = primera temporada entre el resto de la liga y la nueva
+    start = pd.to_numeric(df["season_start_year"], errors="coerce")
+    rookie = start[hit].groupby(keys[hit]).min()
+    stored = pd.to_numeric(df["rookie_season_start_year"], errors="coerce").astype("Float64")
+    updated = stored.copy()
+    updated[hit] = keys[hit].map(rookie)
+
+    changed = int((stored.fillna(-1).ne(updated.fillna(-1)) & hit).iloc[:len(rest)].sum())
+    career = start - updated + 1
+    df["rookie_season_start_year"] = updated
+    df["career_year"] = career.where(career >= 1)
+    return df, changed
+
+
+def ingest(league: str, year: int, path: Path) -> None:
+    t0 = time.perf_counter()
+    if not path.exists():
+        raise FileNotFoundError(f"No existe: {path.resolve()}")
+    if not read_manifest()["partitions"]:
+        raise RuntimeError("No hay master particionado: ejecuta antes scripts/build_master_all_leagues.py")
+
+    new = prepare(LOADERS[league](path, year), league)
+    new = new[pd.to_numeric(new["season_start_year"], errors="coerce") == year]
+    if new.empty:
+        raise ValueError(f"{path} no tiene filas de {league} {year}")
+
+    # La partición es la liga entera (un fichero): se lee, se cambia la temporada y se reescribe
+    schema = master_schema()
+    part = partition_path(league)
+    old = pd.read_parquet(part) if part.exists() else pd.DataFrame(columns=schema.names)
+    existed = bool((pd.to_numeric(old["season_start_year"], errors="coerce") == year).any())
+    df, changed = update_careers(conform(old, schema), conform(new, schema), year)
+
+    table = pa.Table.from_pandas(conform(df, schema), schema=schema, preserve_index=False)
+    entry = write_partition(table, league)
+
+    manifest = read_manifest()
+    manifest["partitions"] = [p for p in manifest["partitions"] if p["league"] != entry["league"]] + [entry]
+    write_manifest(manifest)
+
+    # La copia mapeable es un único fichero: se regenera desde las particiones (ya tipadas)
+    # y al escribirla se publica la nueva versión del master (el dashboard la recoge sola)
+    arrow_path = write_master_arrow(read_master_parquet(), MASTER_ARROW)
+
+    action = "reemplazada" if existed else "nueva"
+    print(f"{league} {year}: temporada {action} ({len(new)} filas) -> {entry['path']} ({entry['rows']} filas)")
+    print(f"Filas de otras temporadas con rookie/career actualizado: {changed}")
+    print(f"Versión publicada: {arrow_path.name}")
+    print(f"Tiempo: {time.perf_counter() - t0:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingesta incremental de una temporada en el master.")
+    parser.add_argument("league", choices=sorted(LOADERS), type=str.upper)
+    parser.add_argument("year", type=int, help="Año de inicio de la temporada (season_start_year)")
+    parser.add_argument("--file", type=Path, default=None, help="CSV de entrada (por defecto el de data_raw/)")
+    args = parser.parse_args()
+
+    ingest(args.league, args.year, args.file or default_file(args.league, args.year))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Normalización de ligas al esquema master a partir de una especificación declarativa.
+
+Cada liga se describe con un LeagueSpec (renombrado de columnas, tipos de
+lectura, formato de temporada, columnas que no trae...) y un único motor la
+ejecuta:
+
+    read_league()  una sola lectura por fichero, con usecols + dtype ya fijados
+    normalize()    renombra, añade league/lg, temporada, NA, rookie/career y ordena
+    run()          read_league + normalize + guardar CSV + checks
+
+Añadir una liga nueva = escribir su LeagueSpec y un script de 3 líneas que llame a run().
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from season_codec import SPAN, YEAR, season_label
+
+# Orden de columnas del master (las que falten se saltan)
+MASTER_ORDER = [
+    "league", "lg",
+    "season", "season_start_year",
+    "player_name", "player_id",
+    "team", "pos", "age", "g",
+    "mp_per_game",
+    "pts_per_game", "ast_per_game", "trb_per_game", "orb_per_game", "drb_per_game",
+    "fg_per_game", "fga_per_game", "fg_percent",
+    "x3p_per_game", "x3pa_per_game", "x3p_percent",
+    "x2p_per_game", "x2pa_per_game", "x2p_percent",
+    "ft_per_game", "fta_per_game", "ft_percent",
+    "stl_per_game", "blk_per_game", "tov_per_game", "pf_per_game",
+    "draft_year", "draft_round", "draft_pick", "draft_team", "college",
+    "rookie_season_start_year", "career_year",
+    "class",
+]
+DRAFT_COLS = ["draft_year", "draft_round", "draft_pick", "draft_team", "college"]
+
+
+@dataclass(frozen=True)
+class LeagueSpec:
+    league: str
+    rename: dict[str, str]                  # columna origen -> columna master
+    dtypes: dict[str, str] = field(default_factory=dict)  # tipo de lectura por columna origen
+    season_style: str = SPAN                # etiqueta de `season` a partir de season_start_year
+    league_cols: tuple[str, ...] = ("league", "lg")
+    na_cols: tuple[str, ...] = ()           # columnas master que la liga no trae -> NA
+    careers: bool = True                    # rookie/career_year si no vienen ya en el fichero
+    columns: list[str] = field(default_factory=lambda: MASTER_ORDER)  # orden de salida
+    keep_extra: bool = True                 # conservar (al final) columnas fuera de `columns`
+    prepare: Callable[[pd.DataFrame], pd.DataFrame] | None = None  # ajustes previos al renombrado
+
+
+def read_league(spec: LeagueSpec, path: Path) -> pd.DataFrame:
+    """Lee el fichero una sola vez: solo las columnas necesarias y con su tipo final."""
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = list(header) if spec.keep_extra else [c for c in header if c in spec.rename]
+    dtype = {c: t for c, t in spec.dtypes.items() if c in usecols}
+    return pd.read_csv(path, usecols=usecols, dtype=dtype)[usecols]
+
+
+def _apply_dtypes(df: pd.DataFrame, spec: LeagueSpec) -> pd.DataFrame:
+    # No-op si el DataFrame viene de read_league; solo convierte lo que llegue de otra fuente
+    for c, t in spec.dtypes.items():
+        if c in df.columns and str(df[c].dtype) != t:
+            df[c] = df[c].astype(t) if t == "string" else pd.to_numeric(df[c], errors="coerce").astype(t)
+    return df
+
+
+def normalize(spec: LeagueSpec, df: pd.DataFrame) -> pd.DataFrame:
+    """Convierte un DataFrame de la liga al esquema master (sin leer ni escribir ficheros)."""
+    df = _apply_dtypes(df.copy(), spec)
+    if spec.prepare is not None:
+        df = spec.prepare(df)
+
+    df = df.rename(columns={k: v for k, v in spec.rename.items() if k in df.columns})
+
+    for c in spec.league_cols:
+        df[c] = spec.league
+
+    if "season_start_year" not in df.columns:
+        raise KeyError(f"{spec.league}: no hay columna de temporada (season_start_year) tras renombrar")
+    df["season"] = season_label(df["season_start_year"], spec.season_style)
+
+    for c in spec.na_cols:
+        if c not in df.columns:
+            df[c] = pd.NA
+
+    # Rookie = primera temporada del jugador dentro de la liga (NaN en el nombre = un grupo)
+    if spec.careers and ("rookie_season_start_year" not in df.columns or "career_year" not in df.columns):
+        start = df["season_start_year"]
+        df["rookie_season_start_year"] = start.groupby(df["player_name"], dropna=False).transform("min")
+        df["career_year"] = start - df["rookie_season_start_year"] + 1
+
+    cols = [c for c in spec.columns if c in df.columns]
+    if spec.keep_extra:
+        cols += [c for c in df.columns if c not in spec.columns]
+    return df[cols]
+
+
+def run(spec: LeagueSpec, in_path: Path, out_path: Path) -> pd.DataFrame:
+    if not in_path.exists():
+        raise FileNotFoundError(f"No existe el input: {in_path.resolve()}")
+
+    df = normalize(spec, read_league(spec, in_path))
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(out_path, index=False)
+
+    # Checks
+    print(f"Saved: {out_path.resolve()}")
+    print(f"Rows: {len(df)} | Cols: {len(df.columns)}")
+    for c in spec.league_cols:
+        print(f"Missing {c}:", df[c].isna().sum())
+    print("Season_start_year min/max:", df["season_start_year"].min(), df["season_start_year"].max())
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Ligas
+# ---------------------------------------------------------------------------
+
+def resolve_wnba_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    El export de Basketball-Reference trae G y MP dos veces (G.1 / MP.1).
+
+    - G: nos quedamos con G y rellenamos sus huecos con G.1
+    - MP: usamos MP.1 si parece por partido (máximo <= 60) y tiene al menos tantos datos
+    """
+    if "G.1" in df.columns and "G" in df.columns:
+        df["G"] = df["G"].fillna(df["G.1"])
+        df = df.drop(columns=["G.1"])
+
+    if "MP.1" in df.columns and "MP" in df.columns:
+        mp1, mp0 = df["MP.1"], df["MP"]
+        if mp1.notna().sum() >= mp0.notna().sum() and mp1.max(skipna=True) <= 60:
+            df["MP"] = mp1
+        df = df.drop(columns=["MP.1"])
+    return df
+
+
+WNBA = LeagueSpec(
+    league="WNBA",
+    rename={
+        "player": "player_name",
+        "Player": "player_name",
+        "season": "season_start_year",
+        "Team": "team",
+        "Pos": "pos",
+        "G": "g",
+        # por partido / porcentajes
+        "MP": "mp_per_game",
+        "FG": "fg_per_game",
+        "FGA": "fga_per_game",
+        "FG%": "fg_percent",
+        "3P": "x3p_per_game",
+        "3PA": "x3pa_per_game",
+        "3P%": "x3p_percent",
+        "2P": "x2p_per_game",
+        "2PA": "x2pa_per_game",
+        "2P%": "x2p_percent",
+        "FT": "ft_per_game",
+        "FTA": "fta_per_game",
+        "FT%": "ft_percent",
+        # la WNBA trae TRB pero no DRB
+        "ORB": "orb_per_game",
+        "TRB": "trb_per_game",
+        "AST": "ast_per_game",
+        "STL": "stl_per_game",
+        "BLK": "blk_per_game",
+        "TOV": "tov_per_game",
+        "PF": "pf_per_game",
+        "PTS": "pts_per_game",
+    },
+    dtypes={
+        "player": "string", "Player": "string", "Team": "string", "Pos": "string",
+        "season": "Int64", "G": "Int64", "G.1": "Int64", "GS": "Int64",
+        "MP": "float64", "MP.1": "float64",
+        **{c: "float64" for c in [
+            "FG", "FGA", "FG%", "3P", "3PA", "3P%", "2P", "2PA", "2P%",
+            "FT", "FTA", "FT%", "ORB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS",
+        ]},
+    },
+    season_style=SPAN,
+    na_cols=("player_id", *DRAFT_COLS),
+    prepare=resolve_wnba_duplicates,
+)
+
+NCAA = LeagueSpec(
+    league="NCAA",
+    # player,cls,year,gp,mpg,ppg,fgm,fga,fg%,3pm,3pa,3p%,ftm,fta,ft%,orb,drb,rpg,apg,spg,bpg,tov,pf
+    rename={
+        "player": "player_name",
+        "year": "season_start_year",   # aquí "year" es la temporada (ej. 2003)
+        "gp": "g",
+        "mpg": "mp_per_game",
+        "ppg": "pts_per_game",
+        "apg": "ast_per_game",
+        "rpg": "trb_per_game",         # rebotes totales por partido
+        "orb": "orb_per_game",
+        "drb": "drb_per_game",
+        "spg": "stl_per_game",
+        "bpg": "blk_per_game",
+        "tov": "tov_per_game",
+        "pf": "pf_per_game",
+        "fgm": "fg_per_game",
+        "fga": "fga_per_game",
+        "fg%": "fg_percent",
+        "3pm": "x3p_per_game",
+        "3pa": "x3pa_per_game",
+        "3p%": "x3p_percent",
+        "ftm": "ft_per_game",
+        "fta": "fta_per_game",
+        "ft%": "ft_percent",
+        "cls": "class",
+    },
+    dtypes={
+        "player": "string", "cls": "string", "year": "Int64", "gp": "Int64",
+        **{c: "float64" for c in [
+            "mpg", "ppg", "fgm", "fga", "fg%", "3pm", "3pa", "3p%", "ftm", "fta", "ft%",
+            "orb", "drb", "rpg", "apg", "spg", "bpg", "tov", "pf",
+        ]},
+    },
+    # El Explorador usa season en un selectbox: para NCAA basta "YYYY"
+    season_style=YEAR,
+    # NCAA no trae team/pos/age/player_id/draft_*; "rookie" = 1er año NCAA que aparece
+    na_cols=("team", "pos", "age", "player_id", *DRAFT_COLS),
+)
+
+LEAGUES = {spec.league: spec for spec in (WNBA, NCAA)}
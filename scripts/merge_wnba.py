@@ -1,53 +1,103 @@
+"""
+Une los CSV por temporada de la WNBA (data_raw/wnba/<año>.csv, export de
+Basketball-Reference) en un único fichero columnar.
+
+- Solo entran los ficheros <año>.csv (nunca las salidas anteriores del pipeline).
+- La cabecera de cada fichero se valida contra el esquema esperado antes de leerlo.
+- Los ficheros se leen en paralelo con un mapa de tipos fijo (sin pasadas de
+  pd.to_numeric) y se escriben en streaming, en orden de temporada, en un Parquet.
+"""
+import csv
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pandas as pd
-import os
-
-# Directorio donde tienes los archivos CSV
-folder_path = "data_raw/wnba"  # Cambia esta ruta a la carpeta donde están tus CSVs
-output_file = "data_raw/wnba/wnba_combined.csv"  # Ruta de salida para el archivo combinado
-
-# Crear una lista de todos los archivos CSV en la carpeta
-files = [f for f in os.listdir(folder_path) if f.endswith('.csv')]
-
-# Lista para almacenar DataFrames
-data_frames = []
-
-# Leer cada archivo CSV y añadirlo a la lista
-for file in files:
-    file_path = os.path.join(folder_path, file)
-    df = pd.read_csv(file_path)
-    
-    # Añadir una columna con el año basado en el nombre del archivo
-    season = file.split('.')[0]  # El nombre del archivo sin la extensión
-    df['year'] = season
-    
-    # Añadir el DataFrame a la lista
-    data_frames.append(df)
-
-# Concatenar todos los DataFrames en uno solo
-wnba_df = pd.concat(data_frames, ignore_index=True)
-
-# Asegurarnos de que las columnas sean del tipo adecuado
-# Convertimos las columnas relevantes a tipos numéricos
-wnba_df["G"] = pd.to_numeric(wnba_df["G"], errors='coerce')
-wnba_df["GS"] = pd.to_numeric(wnba_df["GS"], errors='coerce')
-wnba_df["MP"] = pd.to_numeric(wnba_df["MP"], errors='coerce')
-wnba_df["FG"] = pd.to_numeric(wnba_df["FG"], errors='coerce')
-wnba_df["FGA"] = pd.to_numeric(wnba_df["FGA"], errors='coerce')
-wnba_df["3P"] = pd.to_numeric(wnba_df["3P"], errors='coerce')
-wnba_df["3PA"] = pd.to_numeric(wnba_df["3PA"], errors='coerce')
-wnba_df["FT"] = pd.to_numeric(wnba_df["FT"], errors='coerce')
-wnba_df["FTA"] = pd.to_numeric(wnba_df["FTA"], errors='coerce')
-wnba_df["ORB"] = pd.to_numeric(wnba_df["ORB"], errors='coerce')
-wnba_df["TRB"] = pd.to_numeric(wnba_df["TRB"], errors='coerce')
-wnba_df["AST"] = pd.to_numeric(wnba_df["AST"], errors='coerce')
-wnba_df["STL"] = pd.to_numeric(wnba_df["STL"], errors='coerce')
-wnba_df["BLK"] = pd.to_numeric(wnba_df["BLK"], errors='coerce')
-wnba_df["TOV"] = pd.to_numeric(wnba_df["TOV"], errors='coerce')
-wnba_df["PF"] = pd.to_numeric(wnba_df["PF"], errors='coerce')
-wnba_df["PTS"] = pd.to_numeric(wnba_df["PTS"], errors='coerce')
-
-# Guardar el archivo combinado y normalizado
-wnba_df.to_csv(output_file, index=False)
-
-# Mostrar mensaje de éxito
-print(f"Archivo combinado guardado en: {output_file}")
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+FOLDER_PATH = Path("data_raw/wnba")
+OUTPUT_FILE = FOLDER_PATH / "wnba_combined.parquet"
+SEASON_FILE_RE = re.compile(r"^(\d{4})\.csv$")
+MAX_WORKERS = 4
+
+# Cabecera tal cual la exporta Basketball-Reference (G y MP aparecen dos veces:
+# totales y dentro del bloque "por partido")
+EXPECTED_HEADER = [
+    "Player", "Team", "Pos", "G", "MP", "G", "GS", "MP",
+    "FG", "FGA", "FG%", "3P", "3PA", "3P%", "2P", "2PA", "2P%",
+    "FT", "FTA", "FT%", "ORB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS",
+]
+
+# Tipos por columna ya con los nombres que pone pandas a los duplicados (G.1, MP.1)
+TEXT_COLS = ["Player", "Team", "Pos"]
+NUMERIC_COLS = [
+    "G", "MP", "G.1", "GS", "MP.1",
+    "FG", "FGA", "FG%", "3P", "3PA", "3P%", "2P", "2PA", "2P%",
+    "FT", "FTA", "FT%", "ORB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS",
+]
+DTYPES = {**{c: "string" for c in TEXT_COLS}, **{c: "float64" for c in NUMERIC_COLS}}
+
+# Esquema de salida: Player -> player y la temporada (del nombre del fichero) al final
+RENAME = {"Player": "player"}
+SCHEMA = pa.schema(
+    [(RENAME.get(c, c), pa.string()) for c in TEXT_COLS]
+    + [(c, pa.float64()) for c in NUMERIC_COLS]
+    + [("season", pa.int16())]
+)
+
+
+def season_files(folder: Path = FOLDER_PATH) -> list[tuple[int, Path]]:
+    """(año, ruta) de los ficheros <año>.csv, ordenados por año."""
+    found = []
+    for path in folder.iterdir():
+        m = SEASON_FILE_RE.match(path.name)
+        if m:
+            found.append((int(m.group(1)), path))
+    return sorted(found)
+
+
+def validate_header(path: Path) -> None:
+    with open(path, newline="", encoding="utf-8") as fh:
+        header = next(csv.reader(fh), [])
+    if header != EXPECTED_HEADER:
+        missing = [c for c in EXPECTED_HEADER if c not in header]
+        extra = [c for c in header if c not in EXPECTED_HEADER]
+        raise ValueError(
+            f"{path}: cabecera inesperada (faltan {missing}, sobran {extra}, "
+            f"{len(header)} columnas vs {len(EXPECTED_HEADER)} esperadas)"
+        )
+
+
+def read_season(path: Path, season: int) -> pd.DataFrame:
+    """Un CSV de temporada validado y tipado, con el esquema de salida."""
+    validate_header(path)
+    df = pd.read_csv(path, dtype=DTYPES).rename(columns=RENAME)
+    df["season"] = season
+    return df[SCHEMA.names]
+
+
+def main():
+    files = season_files()
+    if not files:
+        raise FileNotFoundError(f"No hay ficheros <año>.csv en {FOLDER_PATH.resolve()}")
+
+    # Validamos todas las cabeceras antes de escribir nada
+    for _, path in files:
+        validate_header(path)
+
+    tmp = OUTPUT_FILE.with_name(OUTPUT_FILE.name + ".tmp")
+    rows = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool, pq.ParquetWriter(tmp, SCHEMA) as writer:
+        # map conserva el orden de temporada aunque la lectura sea en paralelo
+        for df in pool.map(lambda f: read_season(f[1], f[0]), files):
+            writer.write_table(pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False))
+            rows += len(df)
+    tmp.replace(OUTPUT_FILE)
+
+    print(f"Temporadas: {files[0][0]}-{files[-1][0]} ({len(files)} ficheros), filas: {rows}")
+    print(f"Archivo combinado guardado en: {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,14 @@
-import pandas as pd
+from dataclasses import replace
 from pathlib import Path
 
+from league_normalizer import NCAA, run
+from season_codec import SPAN
 
-def main():
-    in_path = Path("data_raw/ncaa/ncaa-stats-complete.csv")
-    out_path = Path("data_processed/ncaa_players_normalized.csv")
-
-    df = pd.read_csv(in_path)
-
-    # Renombrar columnas
-    df = df.rename(columns={
+# Variante antigua de NCAA (ncaa_players_normalized.csv): menos columnas,
+# season tipo "2003-04", solo lg y sin rookie/career
+NCAA_PLAYERS = replace(
+    NCAA,
+    rename={
         "player": "player_name",
         "gp": "g",
         "mpg": "mp_per_game",
@@ -26,23 +25,13 @@ def main():
         "ft%": "ft_percent",
         "cls": "class_year",
         "year": "season_start_year",
-    })
-
-    # Liga
-    df["lg"] = "NCAA"
-
-    # Season tipo "2003-04"
-    df["season"] = df["season_start_year"].astype(int).astype(str) + "-" + (
-        (df["season_start_year"] + 1).astype(int).astype(str).str[-2:]
-    )
-
-    # Columnas que no existen en NCAA pero sí en el master
-    df["team"] = pd.NA
-    df["pos"] = pd.NA
-    df["player_id"] = pd.NA
-
-    # Seleccionar columnas finales (alineadas con tu Explorador)
-    final_cols = [
+    },
+    season_style=SPAN,
+    league_cols=("lg",),
+    na_cols=("team", "pos", "player_id"),
+    careers=False,
+    # Columnas finales (alineadas con tu Explorador)
+    columns=[
         "player_name",
         "player_id",
         "lg",
@@ -64,18 +53,18 @@ def main():
         "fg_percent",
         "x3p_percent",
         "ft_percent",
-    ]
+    ],
+    keep_extra=False,
+)
+
 
-    final_cols = [c for c in final_cols if c in df.columns]
-    df = df[final_cols]
+def main():
+    in_path = Path("data_raw/ncaa/ncaa-stats-complete.csv")
+    out_path = Path("data_processed/ncaa_players_normalized.csv")
 
-    # Guardar
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_path, index=False)
+    df = run(NCAA_PLAYERS, in_path, out_path)
 
     print("✅ NCAA normalizado")
-    print(f"📄 Archivo: {out_path}")
-    print(f"🔢 Filas: {len(df)}")
     print("🧱 Columnas:")
     for c in df.columns:
         print(" -", c)
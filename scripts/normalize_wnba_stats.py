@@ -1,7 +1,7 @@
 import pandas as pd
 
-# Cargar el archivo combinado
-df = pd.read_csv('data_raw/wnba/wnba_combined.csv')
+# Cargar el archivo combinado (Parquet que escribe merge_wnba.py)
+df = pd.read_parquet('data_raw/wnba/wnba_combined.parquet')
 
 # --- Normalizar la carrera del jugador --- 
 # Calcular la temporada de debut (año de la primera temporada del jugador)
@@ -1,22 +1,7 @@
 from pathlib import Path
 import pandas as pd
 
-def parse_season_start(season_val: str):
-    # Handles "2018-19", "2003-04" and also numeric seasons if any
-    if pd.isna(season_val):
-        return None
-    s = str(season_val).strip()
-    # If format like "2018-19"
-    if "-" in s:
-        try:
-            return int(s.split("-")[0])
-        except Exception:
-            return None
-    # If already a year like 2018
-    try:
-        return int(float(s))
-    except Exception:
-        return None
+from season_codec import season_start_year
 
 def main():
     project_root = Path(__file__).resolve().parent.parent
@@ -27,8 +12,8 @@ def main():
 
     df = pd.read_csv(in_path)
 
-    # Season start year
-    df["season_start_year"] = df["season"].apply(parse_season_start)
+    # Season start year ("2018-19" -> 2018, vectorized)
+    df["season_start_year"] = season_start_year(df["season"])
 
     # Draft flags
     df["drafted_flag"] = df["draft_year"].notna()
@@ -0,0 +1,48 @@
+"""
+Conversión vectorizada de temporadas en ambos sentidos.
+
+    "2018-19" / "2018" / 2018.0  ->  2018          (season_start_year)
+    2018                         ->  "2018-19"     (season_label, estilo "span")
+    2018                         ->  "2018"        (season_label, estilo "year")
+
+Una columna de temporadas tiene muy pocos valores distintos (uno por año), así
+que se parsean solo los valores únicos y el resultado se expande con los códigos.
+"""
+import numpy as np
+import pandas as pd
+
+SPAN = "span"   # "YYYY-YY" (NBA, WNBA)
+YEAR = "year"   # "YYYY" (NCAA en el master)
+
+
+def season_start_year(season: pd.Series) -> pd.Series:
+    """
+    Año de inicio de cada temporada (Int64, NA si no se puede leer).
+
+    Con guion se toma la parte de antes ("2018-19" -> 2018); sin guion se
+    lee como número y se trunca ("2018.0" -> 2018).
+    """
+    codes, uniques = pd.factorize(season, use_na_sentinel=True)
+    s = pd.Series(uniques, dtype="object").astype("string").str.strip()
+
+    dashed = s.str.contains("-", regex=False, na=False)
+    head = s.str.split("-", n=1).str[0]
+    head = head.where(dashed & head.str.fullmatch(r"[+-]?\d+", na=False))
+    plain = pd.to_numeric(s.where(~dashed), errors="coerce")
+
+    start = pd.to_numeric(head, errors="coerce").fillna(np.trunc(plain)).astype("Int64")
+    # Código -1 = NA en la entrada -> NA en la salida (allow_fill)
+    return pd.Series(start.array.take(codes, allow_fill=True), index=season.index)
+
+
+def season_label(start_year: pd.Series, style: str = SPAN) -> pd.Series:
+    """Etiqueta de temporada ("YYYY-YY" o "YYYY") a partir del año de inicio."""
+    if style not in (SPAN, YEAR):
+        raise ValueError(f"Estilo de temporada desconocido: {style!r} (usa {SPAN!r} o {YEAR!r})")
+
+    codes, uniques = pd.factorize(pd.to_numeric(start_year, errors="coerce"), use_na_sentinel=True)
+    y = pd.Series(uniques).astype("Int64")
+    label = y.astype("string")
+    if style == SPAN:
+        label = label + "-" + ((y + 1) % 100).astype("string").str.zfill(2)
+    return pd.Series(label.array.take(codes, allow_fill=True), index=start_year.index)
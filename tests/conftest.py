@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Mismos módulos que importan las páginas (app/) y los scripts del pipeline (scripts/)
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "app"))
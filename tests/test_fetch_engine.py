@@ -0,0 +1,124 @@
+"""FetchEngine con descargas stub (sin red): reintentos, reanudación y respuestas vacías."""
+import time
+
+import pandas as pd
+import pytest
+
+import fetch_engine
+from fetch_engine import FetchEngine, FetchJob, TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    # Backoff y cool-down instantáneos
+    monkeypatch.setattr(fetch_engine.time, "sleep", lambda seconds: None)
+
+
+def engine(tmp_path, **kwargs) -> FetchEngine:
+    return FetchEngine(rate=1000, burst=10, max_workers=2, state_path=tmp_path / "state.json", **kwargs)
+
+
+class Stub:
+    """Devuelve (o lanza) las respuestas en orden y cuenta las llamadas."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self) -> pd.DataFrame:
+        self.calls += 1
+        r = self.responses[min(self.calls, len(self.responses)) - 1]
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+
+ROWS = pd.DataFrame({"PLAYER_NAME": ["A", "B"], "PTS": [10.0, 12.5]})
+
+
+def test_saves_and_resumes(tmp_path):
+    stub = Stub(ROWS)
+    job = FetchJob("2024", stub, tmp_path / "2024.csv")
+
+    assert list(engine(tmp_path).run([job])) == ["2024"]
+    assert pd.read_csv(job.out_path).equals(ROWS)
+
+    # Segunda ejecución: el CSV ya está, no se vuelve a pedir
+    assert engine(tmp_path).run([job]) == {}
+    assert stub.calls == 1
+
+
+def test_retries_then_succeeds(tmp_path):
+    stub = Stub(TimeoutError("timeout"), ConnectionError("reset"), ROWS)
+    job = FetchJob("2024", stub, tmp_path / "2024.csv")
+
+    assert list(engine(tmp_path, max_retries=3).run([job])) == ["2024"]
+    assert stub.calls == 3
+
+
+def test_gives_up_after_max_retries(tmp_path):
+    stub = Stub(TimeoutError("timeout"))
+    job = FetchJob("2024", stub, tmp_path / "2024.csv")
+
+    e = engine(tmp_path, max_retries=3)
+    assert e.run([job]) == {}
+    assert stub.calls == 3
+    assert not job.out_path.exists()
+    assert e._state["failed"]["2024"]["attempts"] == 3
+
+
+def test_empty_response_is_retried_next_run(tmp_path):
+    stub = Stub(pd.DataFrame(columns=ROWS.columns), ROWS)
+    job = FetchJob("2026", stub, tmp_path / "2026.csv")
+
+    e = engine(tmp_path)
+    assert e.run([job]) == {}
+    assert not job.out_path.exists()
+    assert not e.is_done(job)
+    assert e._state["failed"]["2026"]["error"] == "empty response"
+
+    # En la siguiente ejecución ya hay datos
+    e = engine(tmp_path)
+    assert list(e.run([job])) == ["2026"]
+    assert stub.calls == 2
+    assert "2026" not in e._state["failed"]
+
+
+def test_token_bucket_rate(monkeypatch):
+    monkeypatch.undo()     # aquí sí hace falta esperar de verdad
+    bucket = TokenBucket(rate=50, burst=1)
+    t0 = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    # 1 token de ráfaga + 10 a 50/s -> al menos ~0.2s
+    assert time.monotonic() - t0 >= 0.18
+
+
+def test_interrupted_write_is_not_done(tmp_path, monkeypatch):
+    job = FetchJob("2024", Stub(ROWS), tmp_path / "2024.csv")
+    to_csv = pd.DataFrame.to_csv
+
+    def crash(self, path, **kwargs):
+        # Escribe la mitad del fichero y el proceso "muere"
+        path.write_text(to_csv(self, index=False)[:10], encoding="utf-8")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", crash)
+    with pytest.raises(KeyboardInterrupt):
+        engine(tmp_path).run([job])
+    assert not job.out_path.exists()
+    assert not engine(tmp_path).is_done(job)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", to_csv)
+    assert list(engine(tmp_path).run([job])) == ["2024"]
+    assert pd.read_csv(job.out_path).equals(ROWS)
+
+
+def test_refresh_job_is_fetched_again(tmp_path):
+    stub = Stub(ROWS, ROWS.assign(PTS=[11.0, 13.0]))
+    job = FetchJob("2025", stub, tmp_path / "2025.csv", refresh=True)
+
+    engine(tmp_path).run([job])
+    assert list(engine(tmp_path).run([job])) == ["2025"]
+    assert stub.calls == 2
+    assert pd.read_csv(job.out_path)["PTS"].tolist() == [11.0, 13.0]
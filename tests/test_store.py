@@ -0,0 +1,43 @@
+"""Versionado del master publicado (store.write_master_arrow, store.master_source)."""
+import json
+
+import pytest
+
+from store import master_source, write_master_arrow
+
+from test_query_paging import master
+
+
+def publish(df, root):
+    path = write_master_arrow(df, root / "master.arrow", root / "manifest.json")
+    return json.loads((root / "manifest.json").read_text(encoding="utf-8"))["version"], path
+
+
+def test_version_ignores_row_order(tmp_path):
+    df = master()
+    v1, _ = publish(df, tmp_path)
+    v2, _ = publish(df.sample(frac=1, random_state=1), tmp_path)
+    assert v1 == v2
+
+
+def test_version_changes_with_content(tmp_path):
+    df = master()
+    v1, p1 = publish(df, tmp_path)
+    df.loc[0, "pts_per_game"] += 1
+    v2, p2 = publish(df, tmp_path)
+    assert v1 != v2
+    assert p1.exists() and p2.exists()    # la versión anterior se conserva para quien la tenga abierta
+
+
+def test_pruned_version_is_not_served_from_current_data(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)           # rutas por defecto (data_processed/...)
+    df = master()
+    p1 = write_master_arrow(df)
+    df.loc[0, "pts_per_game"] += 1
+    p2 = write_master_arrow(df)
+    v1, v2 = (p.suffixes[0][1:] for p in (p1, p2))
+    p1.unlink()                           # borrada por prune_arrow_versions
+    with pytest.raises(FileNotFoundError):
+        master_source(v1)
+    assert master_source(v2) == p2
+    assert master_source() == p2